@@ -11,8 +11,13 @@ Every action is in the ledger.
 Run this file to get an interactive classroom shell.
 """
 
+import os
+import sys
 import time
 import json
+import atexit
+import contextlib
+from dataclasses import dataclass
 from typing import Optional
 from helena import Helena, WorldPermissions, WorldStatus
 from mary import Status
@@ -22,6 +27,61 @@ from mary import Status
 # Part I — Classroom
 # =============================================================================
 
+# Shared, immutable permission sets handed to every member of a role
+_STUDENT_PERMS = WorldPermissions(
+    read=True, write=True, submit=True,
+    request=True, invite=False, configure=False,
+)
+_ADMIN_PERMS = WorldPermissions(
+    read=True, write=False, submit=False,
+    request=True, invite=False, configure=False,
+)
+
+
+def _unpack_meta(raw: Optional[str]) -> dict:
+    """Decode a packed submission metadata value. Missing means empty."""
+    return json.loads(raw) if raw else {}
+
+
+def _copy_view(view: dict) -> dict:
+    """Copy of a cached gradebook row or tally, grade cells included."""
+    copy = dict(view)
+    copy["grades"] = {aid: dict(cell) for aid, cell in view["grades"].items()}
+    return copy
+
+
+@dataclass(slots=True)
+class Assignment:
+    """An assignment as published by the teacher."""
+    id: str
+    title: str
+    description: str
+    max_points: int
+    created_at: float
+    due_at: float
+    allow_late: bool = False
+    allow_resubmit: bool = True
+
+
+@dataclass(slots=True)
+class Submission:
+    """What this classroom last wrote for a student's submission."""
+    content: str
+    version: int
+    submitted_at: float
+    content_hash: str
+    late: bool = False
+
+
+@dataclass(slots=True)
+class Grade:
+    """What this classroom last wrote for a grade."""
+    score: int
+    max_points: int
+    feedback: str
+    submission_version: int
+
+
 class Classroom:
     """
     A classroom world. Teacher, students, assignments, submissions, grades.
@@ -43,40 +103,53 @@ class Classroom:
         self.world_id = helena.create_world(teacher_id, course_name)
 
         # Initialize course variables
-        helena.world_write(teacher_id, self.world_id, "course.name", course_name)
-        helena.world_write(teacher_id, self.world_id, "course.created_at", time.time())
-        helena.world_write(teacher_id, self.world_id, "course.status", "active")
-        helena.world_write(teacher_id, self.world_id, "assignments", json.dumps([]))
-        helena.world_write(teacher_id, self.world_id, "sessions", json.dumps([]))
+        helena.world_write_many(teacher_id, self.world_id, {
+            "course.name": course_name,
+            "course.created_at": time.time(),
+            "course.status": "active",
+        })
 
         # Track state locally for convenience
-        self._assignments: dict[str, dict] = {}
+        self._assignments: dict[str, Assignment] = {}
         self._next_assignment: int = 1
         self._next_session: int = 1
 
+        # What this classroom wrote, keyed by (student_id, aid)
+        self._submissions: dict[tuple[int, str], Submission] = {}
+        self._grades: dict[tuple[int, str], Grade] = {}
+
+        # Submission variable names per assignment, built once
+        self._sub_keys: dict[str, dict[str, str]] = {}
+        # Grade variable names per (student_id, aid), built once
+        self._grade_keys: dict[tuple[int, str], dict[str, str]] = {}
+
+        # Gradebook rows, reused until something they depend on changes.
+        # Layout version covers assignments; student versions cover their work.
+        self._layout_version: int = 0
+        self._student_version: dict[int, int] = {}
+        self._row_cache: dict[int, tuple[tuple[int, int], dict]] = {}
+        # Transcript tallies, versioned the same way as gradebook rows
+        self._tally_cache: dict[int, tuple[tuple[int, int], dict]] = {}
+
+        # Roster cache: (world membership_version, students)
+        self._roster_cache: Optional[tuple[int, list[dict]]] = None
+
     # ── Enrollment ────────────────────────────────────────────────────
 
     def enroll_student(self, student_id: int) -> bool:
         """Enroll a student. Teacher invites, student joins."""
-        student_perms = WorldPermissions(
-            read=True, write=True, submit=True,
-            request=True, invite=False, configure=False,
-        )
         result = self.helena.invite_to_world(
-            self.teacher_id, student_id, self.world_id, student_perms
+            self.teacher_id, student_id, self.world_id, _STUDENT_PERMS
         )
         if result:
             self.helena.world_write(student_id, self.world_id, "role", "student")
+            self._roster_cache = None
         return result
 
     def add_admin(self, admin_id: int) -> bool:
         """Add an administrator. Read-only."""
-        admin_perms = WorldPermissions(
-            read=True, write=False, submit=False,
-            request=True, invite=False, configure=False,
-        )
         result = self.helena.invite_to_world(
-            self.teacher_id, admin_id, self.world_id, admin_perms
+            self.teacher_id, admin_id, self.world_id, _ADMIN_PERMS
         )
         if result:
             # Admin can't write to world, so teacher records their role
@@ -87,10 +160,14 @@ class Classroom:
         return result
 
     def get_students(self) -> list[dict]:
-        """List enrolled students."""
+        """List enrolled students. Rebuilt when world membership changes."""
         world = self.helena.get_world(self.world_id)
         if not world:
             return []
+        cached = self._roster_cache
+        if cached and cached[0] == world.membership_version:
+            return [dict(s) for s in cached[1]]
+
         students = []
         for sid, member in world.members.items():
             if sid == self.teacher_id or sid == self.helena.speaker.id:
@@ -103,7 +180,8 @@ class Classroom:
                     "id": sid,
                     "name": self.helena.get_speaker_name(sid),
                 })
-        return students
+        self._roster_cache = (world.membership_version, students)
+        return [dict(s) for s in students]
 
     # ── Assignments ───────────────────────────────────────────────────
 
@@ -111,73 +189,71 @@ class Classroom:
                           max_points: int = 100,
                           due_in_hours: float = 168,  # 1 week default
                           allow_late: bool = False,
-                          allow_resubmit: bool = True) -> str:
-        """Create an assignment. Teacher expression."""
-        aid = f"assignment_{self._next_assignment}"
-        self._next_assignment += 1
+                          allow_resubmit: bool = True) -> Optional[str]:
+        """Create an assignment. Teacher expression. None if the world refuses it."""
+        n = self._next_assignment
+        aid = f"assignment_{n}"
 
         now = time.time()
         due_at = now + (due_in_hours * 3600)
 
-        assignment = {
-            "id": aid,
-            "title": title,
-            "description": description,
-            "max_points": max_points,
-            "created_at": now,
-            "due_at": due_at,
-            "allow_late": allow_late,
-            "allow_resubmit": allow_resubmit,
-        }
-
-        self._assignments[aid] = assignment
-
         # Write to teacher's partition in the world
-        self.helena.world_write(self.teacher_id, self.world_id,
-                                f"{aid}.title", title)
-        self.helena.world_write(self.teacher_id, self.world_id,
-                                f"{aid}.description", description)
-        self.helena.world_write(self.teacher_id, self.world_id,
-                                f"{aid}.max_points", max_points)
-        self.helena.world_write(self.teacher_id, self.world_id,
-                                f"{aid}.due_at", due_at)
-        self.helena.world_write(self.teacher_id, self.world_id,
-                                f"{aid}.allow_late", allow_late)
-        self.helena.world_write(self.teacher_id, self.world_id,
-                                f"{aid}.allow_resubmit", allow_resubmit)
-        self.helena.world_write(self.teacher_id, self.world_id,
-                                f"{aid}.status", "published")
+        # Append-only index: one new key per assignment, never a rewrite.
+        # The count rides along in the same write; list via the index prefix.
+        if not self.helena.world_write_many(self.teacher_id, self.world_id, {
+            "assignments.count": n,
+            f"assignments.index.{n}": aid,
+            f"{aid}.title": title,
+            f"{aid}.description": description,
+            f"{aid}.max_points": max_points,
+            f"{aid}.due_at": due_at,
+            f"{aid}.allow_late": allow_late,
+            f"{aid}.allow_resubmit": allow_resubmit,
+            f"{aid}.status": "published",
+        }):
+            return None
+
+        self._next_assignment += 1
+        self._layout_version += 1
+        self._assignments[aid] = Assignment(
+            id=aid,
+            title=title,
+            description=description,
+            max_points=max_points,
+            created_at=now,
+            due_at=due_at,
+            allow_late=allow_late,
+            allow_resubmit=allow_resubmit,
+        )
+        self._sub_keys[aid] = self._submission_keys(aid)
 
         # Expression: teacher publishes assignment
         self.helena.mary.submit(
             speaker_id=self.teacher_id,
             condition_label="class_active",
             action=f"publish:{aid}:{title}",
-            action_fn=lambda: True,
         )
 
-        # Update assignments list
-        aid_list = list(self._assignments.keys())
-        self.helena.world_write(self.teacher_id, self.world_id,
-                                "assignments", json.dumps(aid_list))
-
         return aid
 
-    def get_assignment(self, aid: str) -> Optional[dict]:
+    def get_assignment(self, aid: str) -> Optional[Assignment]:
         """Get assignment details."""
         return self._assignments.get(aid)
 
-    def list_assignments(self) -> list[dict]:
+    def list_assignments(self) -> list[Assignment]:
         """List all assignments."""
         return list(self._assignments.values())
 
     def update_assignment(self, aid: str, field: str, value) -> bool:
         """Update an assignment field. Old value preserved in ledger."""
-        if aid not in self._assignments:
+        assignment = self._assignments.get(aid)
+        if assignment is None:
             return False
 
-        old_value = self._assignments[aid].get(field)
-        self._assignments[aid][field] = value
+        # Fields outside the record still go to the world, as before
+        if hasattr(assignment, field):
+            setattr(assignment, field, value)
+            self._layout_version += 1
 
         self.helena.world_write(self.teacher_id, self.world_id,
                                 f"{aid}.{field}", value)
@@ -186,7 +262,6 @@ class Classroom:
             speaker_id=self.teacher_id,
             condition_label="⊤",
             action=f"update:{aid}.{field}",
-            action_fn=lambda: True,
         )
 
         return True
@@ -205,55 +280,56 @@ class Classroom:
             return {"status": "error", "reason": "assignment_not_found"}
 
         now = time.time()
-        is_late = now > assignment["due_at"]
+        is_late = now > assignment.due_at
 
-        if is_late and not assignment["allow_late"]:
+        if is_late and not assignment.allow_late:
             # Expression is broken — deadline passed, no late allowed
-            self.helena.mary.submit(
+            self.helena.mary.record_broken(
                 speaker_id=student_id,
-                condition=lambda: False,  # deadline passed
                 condition_label=f"deadline >= now for {aid}",
                 action=f"submit:{aid}",
+                reason="deadline_passed",
             )
             return {"status": "broken", "reason": "deadline_passed"}
 
-        # Check for resubmission
-        existing = self.helena.world_read(
-            student_id, self.world_id, student_id, f"sub.{aid}.content"
-        )
-        if existing and not assignment["allow_resubmit"]:
+        # Check for resubmission (local index — no world reads)
+        existing = self._submissions.get((student_id, aid))
+        if existing and not assignment.allow_resubmit:
             return {"status": "error", "reason": "resubmission_not_allowed"}
 
-        version = 1
-        existing_version = self.helena.world_read(
-            student_id, self.world_id, student_id, f"sub.{aid}.version"
-        )
-        if existing_version:
-            version = existing_version + 1
+        version = existing.version + 1 if existing else 1
 
-        # Write to STUDENT'S partition
+        # Write to STUDENT'S partition — content raw, metadata packed
         content_hash = self.helena.hash_content(content)
-        self.helena.world_write(student_id, self.world_id,
-                                f"sub.{aid}.content", content)
-        self.helena.world_write(student_id, self.world_id,
-                                f"sub.{aid}.submitted_at", now)
-        self.helena.world_write(student_id, self.world_id,
-                                f"sub.{aid}.version", version)
-        self.helena.world_write(student_id, self.world_id,
-                                f"sub.{aid}.content_hash", content_hash)
-        self.helena.world_write(student_id, self.world_id,
-                                f"sub.{aid}.late", is_late)
-        self.helena.world_write(student_id, self.world_id,
-                                f"sub.{aid}.status", "submitted")
+        meta = {
+            "submitted_at": now,
+            "version": version,
+            "content_hash": content_hash,
+            "late": is_late,
+            "status": "submitted",
+        }
+        keys = self._sub_keys[aid]
+        if not self.helena.world_write_many(student_id, self.world_id, {
+            keys["content"]: content,
+            keys["meta"]: json.dumps(meta),
+        }):
+            return {"status": "error", "reason": "write_rejected"}
 
         # Expression: student submits
         status_label = "active"
         self.helena.mary.submit(
             speaker_id=student_id,
-            condition=lambda: True,
             condition_label=f"deadline >= now for {aid}" if not is_late else f"late_submit:{aid}",
             action=f"submit:{aid}:v{version}",
-            action_fn=lambda: True,
+        )
+
+        self._touch_student(student_id)
+        self._submissions[(student_id, aid)] = Submission(
+            content=content,
+            version=version,
+            submitted_at=now,
+            content_hash=content_hash,
+            late=is_late,
         )
 
         receipt = {
@@ -271,35 +347,74 @@ class Classroom:
 
     def get_submission(self, caller_id: int, student_id: int, aid: str) -> Optional[dict]:
         """Get a student's submission. Anyone with read access can view."""
-        content = self.helena.world_read(caller_id, self.world_id,
-                                         student_id, f"sub.{aid}.content")
+        keys = self._submission_keys(aid)
+        values = self.helena.world_multi_read(caller_id, self.world_id, student_id,
+                                              [keys["content"], keys["meta"]])
+        content = values.get(keys["content"])
         if content is None:
             return None
 
+        meta = _unpack_meta(values.get(keys["meta"]))
         return {
             "student_id": student_id,
             "student_name": self.helena.get_speaker_name(student_id),
             "assignment_id": aid,
             "content": content,
-            "version": self.helena.world_read(
-                caller_id, self.world_id, student_id, f"sub.{aid}.version"),
-            "submitted_at": self.helena.world_read(
-                caller_id, self.world_id, student_id, f"sub.{aid}.submitted_at"),
-            "content_hash": self.helena.world_read(
-                caller_id, self.world_id, student_id, f"sub.{aid}.content_hash"),
-            "late": self.helena.world_read(
-                caller_id, self.world_id, student_id, f"sub.{aid}.late"),
+            "version": meta.get("version"),
+            "submitted_at": meta.get("submitted_at"),
+            "content_hash": meta.get("content_hash"),
+            "late": meta.get("late"),
         }
 
+    def _submission_keys(self, aid: str) -> dict[str, str]:
+        """Submission variable names for an assignment (built for unknown ids)."""
+        keys = self._sub_keys.get(aid)
+        if keys is None:
+            keys = {"content": f"sub.{aid}.content", "meta": f"sub.{aid}.meta",
+                    "prefix": f"sub.{aid}."}
+        return keys
+
     def get_all_submissions(self, aid: str) -> list[dict]:
         """Get all submissions for an assignment (teacher view)."""
+        # One prefix-scoped read per student partition instead of a read per field
+        students = self.get_students()
+        snap = self.helena.world_snapshot(self.teacher_id, self.world_id,
+                                          key_prefix=self._submission_keys(aid)["prefix"],
+                                          owner_ids=[s["id"] for s in students])
         submissions = []
-        for student in self.get_students():
-            sub = self.get_submission(self.teacher_id, student["id"], aid)
+        for student in students:
+            sub = self._submission_from(snap, student["id"], aid)
             if sub:
+                sub["student_name"] = student["name"]
                 submissions.append(sub)
         return submissions
 
+    def matching_submissions(self, aid: str) -> list[list[int]]:
+        """Groups of students whose latest submissions share a content hash."""
+        by_hash: dict[str, list[int]] = {}
+        for (student_id, sub_aid), sub in self._submissions.items():
+            if sub_aid == aid:
+                by_hash.setdefault(sub.content_hash, []).append(student_id)
+        return [ids for ids in by_hash.values() if len(ids) > 1]
+
+    def _submission_from(self, snap: dict, student_id: int, aid: str) -> Optional[dict]:
+        """Build a submission record from a world snapshot."""
+        keys = self._submission_keys(aid)
+        content = snap.get((student_id, keys["content"]))
+        if content is None:
+            return None
+
+        meta = _unpack_meta(snap.get((student_id, keys["meta"])))
+        return {
+            "student_id": student_id,
+            "assignment_id": aid,
+            "content": content,
+            "version": meta.get("version"),
+            "submitted_at": meta.get("submitted_at"),
+            "content_hash": meta.get("content_hash"),
+            "late": meta.get("late"),
+        }
+
     # ── Grading ───────────────────────────────────────────────────────
 
     def grade(self, student_id: int, aid: str, score: int,
@@ -308,6 +423,8 @@ class Classroom:
         Teacher grades a submission. Grade is TEACHER'S variable.
         Student CANNOT modify it. Mary enforces this.
         """
+        now = time.time()
+
         # Check submission exists
         sub = self.get_submission(self.teacher_id, student_id, aid)
         if not sub:
@@ -316,28 +433,33 @@ class Classroom:
         assignment = self._assignments.get(aid)
         if not assignment:
             return {"status": "error", "reason": "assignment_not_found"}
+        max_points = assignment.max_points
 
         # Write to TEACHER'S partition
-        self.helena.world_write(self.teacher_id, self.world_id,
-                                f"grade.{student_id}.{aid}.score", score)
-        self.helena.world_write(self.teacher_id, self.world_id,
-                                f"grade.{student_id}.{aid}.max", assignment["max_points"])
-        self.helena.world_write(self.teacher_id, self.world_id,
-                                f"grade.{student_id}.{aid}.feedback", feedback)
-        self.helena.world_write(self.teacher_id, self.world_id,
-                                f"grade.{student_id}.{aid}.graded_at", time.time())
-        self.helena.world_write(self.teacher_id, self.world_id,
-                                f"grade.{student_id}.{aid}.submission_version", sub["version"])
-        self.helena.world_write(self.teacher_id, self.world_id,
-                                f"grade.{student_id}.{aid}.submission_hash", sub["content_hash"])
+        keys = self._grade_keys_for(student_id, aid)
+        if not self.helena.world_write_many(self.teacher_id, self.world_id, {
+            keys["score"]: score,
+            keys["max"]: max_points,
+            keys["feedback"]: feedback,
+            keys["graded_at"]: now,
+            keys["submission_version"]: sub["version"],
+            keys["submission_hash"]: sub["content_hash"],
+        }):
+            return {"status": "error", "reason": "write_rejected"}
+
+        self._touch_student(student_id)
+        self._grades[(student_id, aid)] = Grade(
+            score=score,
+            max_points=max_points,
+            feedback=feedback,
+            submission_version=sub["version"],
+        )
 
         # Expression: teacher grades
         self.helena.mary.submit(
             speaker_id=self.teacher_id,
-            condition=lambda: True,
             condition_label=f"student.{student_id}.submission.{aid} = active",
-            action=f"grade:{student_id}:{aid}:{score}/{assignment['max_points']}",
-            action_fn=lambda: True,
+            action=f"grade:{student_id}:{aid}:{score}/{max_points}",
         )
 
         return {
@@ -345,15 +467,19 @@ class Classroom:
             "student_id": student_id,
             "assignment_id": aid,
             "score": score,
-            "max": assignment["max_points"],
+            "max": max_points,
             "feedback": feedback,
             "submission_version": sub["version"],
         }
 
     def get_grade(self, caller_id: int, student_id: int, aid: str) -> Optional[dict]:
         """Get a grade. Students can read their own grades."""
-        score = self.helena.world_read(caller_id, self.world_id,
-                                       self.teacher_id, f"grade.{student_id}.{aid}.score")
+        keys = self._grade_keys_for(student_id, aid)
+        values = self.helena.world_multi_read(
+            caller_id, self.world_id, self.teacher_id,
+            [keys["score"], keys["max"], keys["feedback"],
+             keys["submission_version"]])
+        score = values.get(keys["score"])
         if score is None:
             return None
 
@@ -361,92 +487,141 @@ class Classroom:
             "student_id": student_id,
             "assignment_id": aid,
             "score": score,
-            "max": self.helena.world_read(
-                caller_id, self.world_id, self.teacher_id,
-                f"grade.{student_id}.{aid}.max"),
-            "feedback": self.helena.world_read(
-                caller_id, self.world_id, self.teacher_id,
-                f"grade.{student_id}.{aid}.feedback"),
-            "submission_version": self.helena.world_read(
-                caller_id, self.world_id, self.teacher_id,
-                f"grade.{student_id}.{aid}.submission_version"),
+            "max": values.get(keys["max"]),
+            "feedback": values.get(keys["feedback"]),
+            "submission_version": values.get(keys["submission_version"]),
         }
 
+    def _grade_keys_for(self, student_id: int, aid: str) -> dict[str, str]:
+        """Grade variable names for one (student, assignment); cached for known ids."""
+        keys = self._grade_keys.get((student_id, aid))
+        if keys is None:
+            prefix = f"grade.{student_id}.{aid}."
+            keys = {field: prefix + field for field in (
+                "score", "max", "feedback", "graded_at",
+                "submission_version", "submission_hash")}
+            if aid in self._assignments:
+                self._grade_keys[(student_id, aid)] = keys
+        return keys
+
+    def student_report(self, caller_id: int,
+                       student_id: int) -> list[tuple[str, str, object, object, str]]:
+        """
+        One student's standing on every assignment, as the caller sees it.
+        Rows are (aid, state, score, max, feedback); state is "graded",
+        "submitted" or "missing". Two reads total: grades, then submissions.
+        """
+        grades = self.helena.world_read_prefix(caller_id, self.world_id,
+                                               self.teacher_id, f"grade.{student_id}.")
+        subs = self.helena.world_read_prefix(caller_id, self.world_id,
+                                             student_id, "sub.")
+
+        report = []
+        for aid in self._assignments:
+            keys = self._grade_keys_for(student_id, aid)
+            score = grades.get(keys["score"])
+            if score is not None:
+                report.append((aid, "graded", score, grades.get(keys["max"]),
+                               grades.get(keys["feedback"]) or ""))
+            elif subs.get(self._submission_keys(aid)["content"]) is not None:
+                report.append((aid, "submitted", None, None, ""))
+            else:
+                report.append((aid, "missing", None, None, ""))
+        return report
+
     # ── Gradebook ─────────────────────────────────────────────────────
 
+    def _touch_student(self, student_id: int):
+        """A student's submissions or grades changed: their row is stale."""
+        self._student_version[student_id] = self._student_version.get(student_id, 0) + 1
+
     def gradebook(self) -> list[dict]:
         """
         Computed view. Reads existing state. Computes nothing new.
+        Rows are cached per student; callers get copies.
         """
         rows = []
         students = self.get_students()
-        assignments = self.list_assignments()
+        # Assignment columns, built once and shared by every row
+        columns = [(a.id, a.max_points) for a in self.list_assignments()]
+        grades = self._grades
+        submissions = self._submissions
+        row_cache = self._row_cache
 
         for student in students:
-            row = {
-                "student": student["name"],
-                "student_id": student["id"],
-                "grades": {},
-            }
-            total_score = 0
-            total_max = 0
+            sid = student["id"]
+            version = (self._layout_version, self._student_version.get(sid, 0))
+            cached = row_cache.get(sid)
+            if cached and cached[0] == version:
+                rows.append(_copy_view(cached[1]))
+                continue
 
-            for assignment in assignments:
-                aid = assignment["id"]
-                grade = self.get_grade(self.teacher_id, student["id"], aid)
-                sub = self.get_submission(self.teacher_id, student["id"], aid)
+            cells = {}
+            scores = []
+            maxes = []
 
+            for aid, max_points in columns:
+                grade = grades.get((sid, aid))
                 if grade:
-                    row["grades"][aid] = {
-                        "score": grade["score"],
-                        "max": grade["max"],
-                        "submitted": True,
-                    }
-                    total_score += grade["score"]
-                    total_max += grade["max"]
-                elif sub:
-                    row["grades"][aid] = {
-                        "score": "pending",
-                        "max": assignment["max_points"],
-                        "submitted": True,
-                    }
+                    cells[aid] = {"score": grade.score, "max": grade.max_points,
+                                  "submitted": True}
+                    scores.append(grade.score)
+                    maxes.append(grade.max_points)
+                elif (sid, aid) in submissions:
+                    cells[aid] = {"score": "pending", "max": max_points,
+                                  "submitted": True}
                 else:
-                    row["grades"][aid] = {
-                        "score": "—",
-                        "max": assignment["max_points"],
-                        "submitted": False,
-                    }
+                    cells[aid] = {"score": "—", "max": max_points,
+                                  "submitted": False}
 
-            row["total"] = f"{total_score}/{total_max}" if total_max > 0 else "—"
-            row["percentage"] = round(total_score / total_max * 100, 1) if total_max > 0 else 0
-            rows.append(row)
+            total_score = sum(scores)
+            total_max = sum(maxes)
+            row = {
+                "student": student["name"],
+                "student_id": sid,
+                "grades": cells,
+                "total": f"{total_score}/{total_max}" if total_max > 0 else "—",
+                "percentage": round(total_score / total_max * 100, 1) if total_max > 0 else 0,
+            }
+            row_cache[sid] = (version, row)
+            rows.append(_copy_view(row))
 
         return rows
 
+    def gradebook_flat(self) -> dict[tuple[int, str], object]:
+        """
+        Gradebook cells keyed by (student_id, aid): the score, or "pending"
+        if submitted but ungraded. Cells with no submission are absent.
+        """
+        cells = dict.fromkeys(self._submissions, "pending")
+        for key, grade in self._grades.items():
+            cells[key] = grade.score
+        return cells
+
     # ── Attendance ────────────────────────────────────────────────────
 
-    def open_session(self, title: str = "", duration_minutes: int = 60) -> str:
-        """Teacher opens a class session."""
-        sid = f"session_{self._next_session}"
-        self._next_session += 1
+    def open_session(self, title: str = "", duration_minutes: int = 60) -> Optional[str]:
+        """Teacher opens a class session. None if the world refuses it."""
+        n = self._next_session
+        sid = f"session_{n}"
 
         now = time.time()
         end = now + (duration_minutes * 60)
 
-        self.helena.world_write(self.teacher_id, self.world_id,
-                                f"{sid}.title", title or f"Session {self._next_session - 1}")
-        self.helena.world_write(self.teacher_id, self.world_id,
-                                f"{sid}.start", now)
-        self.helena.world_write(self.teacher_id, self.world_id,
-                                f"{sid}.end", end)
-        self.helena.world_write(self.teacher_id, self.world_id,
-                                f"{sid}.status", "open")
+        if not self.helena.world_write_many(self.teacher_id, self.world_id, {
+            f"sessions.index.{n}": sid,
+            f"{sid}.title": title or f"Session {n}",
+            f"{sid}.start": now,
+            f"{sid}.end": end,
+            f"{sid}.status": "open",
+        }):
+            return None
+        self._next_session += 1
 
         self.helena.mary.submit(
             speaker_id=self.teacher_id,
             condition_label="⊤",
             action=f"open_session:{sid}",
-            action_fn=lambda: True,
         )
 
         return sid
@@ -466,10 +641,8 @@ class Classroom:
 
         self.helena.mary.submit(
             speaker_id=student_id,
-            condition=lambda: True,
             condition_label=f"session.{session_id}.active",
             action=f"check_in:{session_id}",
-            action_fn=lambda: True,
         )
 
         return {"status": "active", "checked_in_at": now}
@@ -493,7 +666,27 @@ class Classroom:
     # ── Transcript ────────────────────────────────────────────────────
 
     def transcript(self, student_id: int) -> dict:
-        """Generate transcript record for a student."""
+        """
+        Generate transcript record for a student.
+        Names and the ledger hash are read fresh; the grade tally is reused
+        until the student's work or the assignment set changes.
+        """
+        return {
+            "student_id": student_id,
+            "student_name": self.helena.get_speaker_name(student_id),
+            "course": self.course_name,
+            "teacher": self.helena.get_speaker_name(self.teacher_id),
+            **self._tally(student_id),
+            "ledger_hash": self._ledger_head(),
+        }
+
+    def _tally(self, student_id: int) -> dict:
+        """Grades, totals and submission counts for a transcript."""
+        version = (self._layout_version, self._student_version.get(student_id, 0))
+        cached = self._tally_cache.get(student_id)
+        if cached and cached[0] == version:
+            return _copy_view(cached[1])
+
         grades = {}
         total_score = 0
         total_max = 0
@@ -501,36 +694,149 @@ class Classroom:
         missed = 0
 
         for aid, assignment in self._assignments.items():
-            grade = self.get_grade(self.teacher_id, student_id, aid)
-            sub = self.get_submission(self.teacher_id, student_id, aid)
+            grade = self._grades.get((student_id, aid))
+            sub = (student_id, aid) in self._submissions
 
             if grade:
-                grades[aid] = {"score": grade["score"], "max": grade["max"]}
-                total_score += grade["score"]
-                total_max += grade["max"]
+                grades[aid] = {"score": grade.score, "max": grade.max_points}
+                total_score += grade.score
+                total_max += grade.max_points
             if sub:
                 submitted += 1
             else:
                 missed += 1
 
-        return {
-            "student_id": student_id,
-            "student_name": self.helena.get_speaker_name(student_id),
-            "course": self.course_name,
-            "teacher": self.helena.get_speaker_name(self.teacher_id),
+        tally = {
             "grades": grades,
             "final_score": f"{total_score}/{total_max}",
             "percentage": round(total_score / total_max * 100, 1) if total_max > 0 else 0,
             "assignments_submitted": submitted,
             "assignments_missed": missed,
-            "ledger_hash": self.helena.mary.ledger.last().entry_hash if self.helena.mary.ledger.last() else "",
         }
+        self._tally_cache[student_id] = (version, tally)
+        return _copy_view(tally)
+
+    def _ledger_head(self) -> str:
+        """Hash of the newest ledger entry."""
+        last = self.helena.mary.ledger.last()
+        return last.entry_hash if last else ""
 
 
 # =============================================================================
 # Part II — Interactive Shell
 # =============================================================================
 
+_HISTORY_FILE = os.path.expanduser("~/.classroom_history")
+
+# verb -> (ClassroomShell method, takes args). Built once, read per command.
+_COMMANDS: dict[str, tuple[str, bool]] = {
+    "help": ("print_help", False),
+    "enroll": ("do_enroll", True),
+    "students": ("do_students", False),
+    "assign": ("do_assign", True),
+    "assignments": ("do_assignments", False),
+    "be": ("do_switch", True),
+    "submit": ("do_submit", True),
+    "submissions": ("do_submissions", True),
+    "grade": ("do_grade", True),
+    "grades": ("do_grades", True),
+    "gradebook": ("do_gradebook", False),
+    "dispute": ("do_dispute", True),
+    "session": ("do_session", True),
+    "checkin": ("do_checkin", True),
+    "inspect": ("do_inspect", True),
+    "audit": ("do_audit", False),
+    "ledger": ("do_ledger", False),
+    "transcript": ("do_transcript", True),
+    "archive": ("do_archive", False),
+    "status": ("do_status", False),
+    "tamper": ("do_tamper", True),
+    "admin": ("do_admin", True),
+}
+
+_TRANSCRIPT_TEMPLATE = """
+    ╔══════════════════════════════════════════════╗
+    ║  TRANSCRIPT                                  ║
+    ╠══════════════════════════════════════════════╣
+    ║  Student: {student_name:<35} ║
+    ║  Course:  {course:<35} ║
+    ║  Teacher: {teacher:<35} ║
+    ║  Final:   {final_line:<30}║
+    ║  Submitted: {assignments_submitted:<33} ║
+    ║  Missed:    {assignments_missed:<33} ║
+    ║  Ledger:    {ledger_hash:<33} ║
+    ╚══════════════════════════════════════════════╝
+"""
+
+_HELP = """\
+  COMMANDS:
+  ─────────────────────────────────────────────
+  SETUP:
+    enroll <name>         — Add a student
+    admin <name>          — Add an admin (read-only)
+    students              — List students
+    be <name>             — Switch speaker (be a student)
+    be teacher            — Switch back to teacher
+
+  ASSIGNMENTS:
+    assign <title>        — Create an assignment
+    assignments           — List all assignments
+
+  STUDENT ACTIONS (switch to student first with 'be'):
+    submit <assignment_id> — Submit work
+    checkin <session_id>   — Check in to session
+    dispute <assignment_id> — Dispute a grade
+
+  TEACHER ACTIONS:
+    submissions <a_id>    — View submissions for assignment
+    grade <student> <a_id> <score> — Grade a submission
+    grades <student>      — View student's grades
+    gradebook             — Full gradebook
+    session <title>       — Open a class session
+    transcript <student>  — Generate transcript
+    archive               — Archive the classroom
+
+  INSPECTION:
+    inspect <target>      — Inspect speaker or variable
+    audit                 — Full world audit
+    ledger                — View recent ledger entries
+    status                — System status
+
+  DEMO:
+    tamper <student>      — Try to modify student work (will fail)
+
+    quit                  — Exit
+
+"""
+
+# Per-line templates for the long list views
+_LEDGER_LINE_FMT = "      #%s [%8s] %s: %s"
+_SUBMISSION_LINE_FMT = "      %s (v%s)%s: %s..."
+_GRADEBOOK_CELL_FMT = "%4s"
+
+_QUIT_VERBS = frozenset(("quit", "exit", "q"))
+
+_COMMAND_NAMES = (*_COMMANDS, "quit")
+
+
+@contextlib.contextmanager
+def _command_output():
+    """
+    Block-buffer stdout for one command and flush once at the end.
+    input() still flushes before prompting, so prompts are never held back.
+    """
+    stdout = sys.stdout
+    line_buffered = getattr(stdout, "line_buffering", False)
+    if line_buffered:
+        stdout.reconfigure(line_buffering=False)
+    try:
+        yield
+    finally:
+        if line_buffered:
+            stdout.reconfigure(line_buffering=True)
+        stdout.flush()
+
+
 class ClassroomShell:
     """
     Interactive shell for the Classroom World.
@@ -544,8 +850,10 @@ class ClassroomShell:
         self.classroom = None
         self.teacher_id = None
         self.current_speaker = None  # for switching between teacher/student
-        self._students: dict[str, int] = {}  # name -> id
+        self._students: dict[str, int] = {}  # casefolded name -> id
         self._admin_id = None
+        self._matches: list[str] = []  # current tab-completion candidates
+        self._name_cache: dict[int, str] = {}  # speaker_id -> display name
 
     def start(self):
         """Boot the shell."""
@@ -570,6 +878,7 @@ class ClassroomShell:
 
         # Create teacher speaker
         self.teacher_id = self.helena.create_speaker(teacher_name)
+        self._name_cache[self.teacher_id] = teacher_name
         self.current_speaker = self.teacher_id
 
         # Create classroom
@@ -578,16 +887,18 @@ class ClassroomShell:
         print(f"  ✓ Teacher: {teacher_name} (speaker #{self.teacher_id})")
         print()
 
+        self._setup_readline()
+
         # Main loop
         self.print_help()
         while True:
             try:
-                who = self.helena.get_speaker_name(self.current_speaker)
+                who = self._name(self.current_speaker)
                 prompt = f"  [{who}] > "
                 cmd = input(prompt).strip()
                 if not cmd:
                     continue
-                if cmd.lower() in ("quit", "exit", "q"):
+                if cmd.lower() in _QUIT_VERBS:
                     self.do_quit()
                     break
                 self.dispatch(cmd)
@@ -596,84 +907,66 @@ class ClassroomShell:
                 self.do_quit()
                 break
 
+    def _setup_readline(self):
+        """Line editing and history when a terminal is attached."""
+        if not sys.stdin.isatty():
+            return
+        try:
+            import readline  # optional: line editing, history, tab completion
+        except ImportError:
+            return
+        readline.set_completer(self._complete)
+        readline.parse_and_bind("tab: complete")
+        try:
+            readline.read_history_file(_HISTORY_FILE)
+        except OSError:
+            pass
+        atexit.register(readline.write_history_file, _HISTORY_FILE)
+
+    def _complete(self, text: str, state: int) -> Optional[str]:
+        """Tab completion over command names and speaker names."""
+        if state == 0:
+            names = sorted({*_COMMAND_NAMES, *self._students, "teacher", "admin"})
+            self._matches = [n for n in names if n.startswith(text.casefold())]
+        return self._matches[state] if state < len(self._matches) else None
+
+    def _name(self, speaker_id: int) -> str:
+        """Speaker display name. Speakers never rename, so look each up once."""
+        name = self._name_cache.get(speaker_id)
+        if name is None:
+            name = self.helena.get_speaker_name(speaker_id)
+            self._name_cache[speaker_id] = name
+        return name
+
+    def _resolve_student(self, name: str) -> Optional[int]:
+        """Student id for a typed name, any case. None if not enrolled."""
+        return self._students.get(name.casefold())
+
     def dispatch(self, cmd: str):
         """Route a command."""
         parts = cmd.split(None, 1)
-        verb = parts[0].lower()
-        args = parts[1] if len(parts) > 1 else ""
-
-        commands = {
-            "help": lambda: self.print_help(),
-            "enroll": lambda: self.do_enroll(args),
-            "students": lambda: self.do_students(),
-            "assign": lambda: self.do_assign(args),
-            "assignments": lambda: self.do_assignments(),
-            "be": lambda: self.do_switch(args),
-            "submit": lambda: self.do_submit(args),
-            "submissions": lambda: self.do_submissions(args),
-            "grade": lambda: self.do_grade(args),
-            "grades": lambda: self.do_grades(args),
-            "gradebook": lambda: self.do_gradebook(),
-            "dispute": lambda: self.do_dispute(args),
-            "session": lambda: self.do_session(args),
-            "checkin": lambda: self.do_checkin(args),
-            "inspect": lambda: self.do_inspect(args),
-            "audit": lambda: self.do_audit(),
-            "ledger": lambda: self.do_ledger(),
-            "transcript": lambda: self.do_transcript(args),
-            "archive": lambda: self.do_archive(),
-            "status": lambda: self.do_status(),
-            "tamper": lambda: self.do_tamper(args),
-            "admin": lambda: self.do_admin(args),
-        }
+        # Interned so the table probe is an identity hit for known verbs
+        verb = sys.intern(parts[0].lower())
+        # Handlers get args already stripped
+        args = parts[1].strip() if len(parts) > 1 else ""
 
-        fn = commands.get(verb)
-        if fn:
-            fn()
-        else:
+        entry = _COMMANDS.get(verb)
+        if entry is None:
             print(f"    Unknown command: {verb}. Type 'help' for commands.")
+            return
+
+        method_name, takes_args = entry
+        method = getattr(self, method_name)
+        with _command_output():
+            if takes_args:
+                method(args)
+            else:
+                method()
 
     # ── Commands ──────────────────────────────────────────────────────
 
     def print_help(self):
-        print("  COMMANDS:")
-        print("  ─────────────────────────────────────────────")
-        print("  SETUP:")
-        print("    enroll <name>         — Add a student")
-        print("    admin <name>          — Add an admin (read-only)")
-        print("    students              — List students")
-        print("    be <name>             — Switch speaker (be a student)")
-        print("    be teacher            — Switch back to teacher")
-        print()
-        print("  ASSIGNMENTS:")
-        print("    assign <title>        — Create an assignment")
-        print("    assignments           — List all assignments")
-        print()
-        print("  STUDENT ACTIONS (switch to student first with 'be'):")
-        print("    submit <assignment_id> — Submit work")
-        print("    checkin <session_id>   — Check in to session")
-        print("    dispute <assignment_id> — Dispute a grade")
-        print()
-        print("  TEACHER ACTIONS:")
-        print("    submissions <a_id>    — View submissions for assignment")
-        print("    grade <student> <a_id> <score> — Grade a submission")
-        print("    grades <student>      — View student's grades")
-        print("    gradebook             — Full gradebook")
-        print("    session <title>       — Open a class session")
-        print("    transcript <student>  — Generate transcript")
-        print("    archive               — Archive the classroom")
-        print()
-        print("  INSPECTION:")
-        print("    inspect <target>      — Inspect speaker or variable")
-        print("    audit                 — Full world audit")
-        print("    ledger                — View recent ledger entries")
-        print("    status                — System status")
-        print()
-        print("  DEMO:")
-        print("    tamper <student>      — Try to modify student work (will fail)")
-        print()
-        print("    quit                  — Exit")
-        print()
+        sys.stdout.write(_HELP)
 
     def do_enroll(self, name: str):
         if not name:
@@ -681,8 +974,9 @@ class ClassroomShell:
         if not name:
             return
         sid = self.helena.create_speaker(name)
+        self._name_cache[sid] = name
         self.classroom.enroll_student(sid)
-        self._students[name.lower()] = sid
+        self._students[sys.intern(name.casefold())] = sid
         print(f"    ✓ Enrolled: {name} (speaker #{sid})")
 
     def do_students(self):
@@ -690,22 +984,23 @@ class ClassroomShell:
         if not students:
             print("    No students enrolled yet.")
             return
-        print("    ENROLLED STUDENTS:")
-        for s in students:
-            print(f"      #{s['id']}  {s['name']}")
+        out = ["    ENROLLED STUDENTS:"]
+        out.extend(f"      #{s['id']}  {s['name']}" for s in students)
+        sys.stdout.write("\n".join(out) + "\n")
 
     def do_switch(self, name: str):
         if not name:
             name = input("    Switch to: ").strip()
-        if name.lower() == "teacher":
+        key = name.casefold()
+        if key == "teacher":
             self.current_speaker = self.teacher_id
-            print(f"    ✓ Now speaking as: {self.helena.get_speaker_name(self.teacher_id)} (teacher)")
+            print(f"    ✓ Now speaking as: {self._name(self.teacher_id)} (teacher)")
             return
-        if name.lower() == "admin" and self._admin_id:
+        if key == "admin" and self._admin_id:
             self.current_speaker = self._admin_id
             print(f"    ✓ Now speaking as: admin (read-only)")
             return
-        sid = self._students.get(name.lower())
+        sid = self._resolve_student(name)
         if sid:
             self.current_speaker = sid
             print(f"    ✓ Now speaking as: {name} (student)")
@@ -720,17 +1015,19 @@ class ClassroomShell:
             title = input("    Assignment title: ").strip()
 
         # Parse optional points from title: "Build a Calculator 100"
+        # Point totals are plain non-negative integers; isascii() keeps
+        # Unicode digits like "²" out, since int() would reject them
         parts = title.rsplit(None, 1)
         points = 100
-        if len(parts) == 2:
-            try:
-                points = int(parts[1])
-                title = parts[0]
-            except ValueError:
-                pass
+        if len(parts) == 2 and parts[1].isascii() and parts[1].isdigit():
+            points = int(parts[1])
+            title = parts[0]
 
         desc = "Complete the assignment."
         aid = self.classroom.create_assignment(title, desc, max_points=points)
+        if not aid:
+            print("    ✗ The course world refused the assignment.")
+            return
         print(f"    ✓ Assignment created: {aid} — {title} ({points} pts)")
 
     def do_assignments(self):
@@ -738,9 +1035,9 @@ class ClassroomShell:
         if not assignments:
             print("    No assignments yet.")
             return
-        print("    ASSIGNMENTS:")
-        for a in assignments:
-            print(f"      {a['id']}  {a['title']}  ({a['max_points']} pts)")
+        out = ["    ASSIGNMENTS:"]
+        out.extend(f"      {a.id}  {a.title}  ({a.max_points} pts)" for a in assignments)
+        sys.stdout.write("\n".join(out) + "\n")
 
     def do_submit(self, args: str):
         if self.current_speaker == self.teacher_id:
@@ -749,7 +1046,7 @@ class ClassroomShell:
         if not args:
             args = input("    Assignment ID: ").strip()
 
-        aid = args.strip()
+        aid = args
         print(f"    Submitting to {aid}. Enter your work (one line):")
         content = input("    > ").strip()
         if not content:
@@ -771,15 +1068,17 @@ class ClassroomShell:
     def do_submissions(self, args: str):
         if not args:
             args = input("    Assignment ID: ").strip()
-        aid = args.strip()
+        aid = args
         subs = self.classroom.get_all_submissions(aid)
         if not subs:
             print(f"    No submissions for {aid}.")
             return
-        print(f"    SUBMISSIONS FOR {aid}:")
+        out = [f"    SUBMISSIONS FOR {aid}:"]
         for s in subs:
             late = " [LATE]" if s.get("late") else ""
-            print(f"      {s['student_name']} (v{s['version']}){late}: {s['content'][:50]}...")
+            out.append(_SUBMISSION_LINE_FMT % (s['student_name'], s['version'], late,
+                                               s['content'][:50]))
+        sys.stdout.write("\n".join(out) + "\n")
 
     def do_grade(self, args: str):
         if self.current_speaker != self.teacher_id:
@@ -796,7 +1095,7 @@ class ClassroomShell:
             aid = parts[1]
             score_str = parts[2]
 
-        sid = self._students.get(student_name.lower())
+        sid = self._resolve_student(student_name)
         if not sid:
             print(f"    ✗ Unknown student: {student_name}")
             return
@@ -812,7 +1111,7 @@ class ClassroomShell:
 
         if result["status"] == "active":
             print(f"    ✓ GRADED")
-            print(f"      Student: {self.helena.get_speaker_name(sid)}")
+            print(f"      Student: {self._name(sid)}")
             print(f"      Assignment: {aid}")
             print(f"      Score: {score}/{result['max']}")
             print(f"      Based on submission v{result['submission_version']}")
@@ -822,23 +1121,21 @@ class ClassroomShell:
     def do_grades(self, args: str):
         if not args:
             args = input("    Student name: ").strip()
-        name = args.strip().lower()
-        sid = self._students.get(name)
+        sid = self._resolve_student(args)
         if not sid:
             print(f"    ✗ Unknown student: {args}")
             return
 
-        print(f"    GRADES FOR {self.helena.get_speaker_name(sid)}:")
-        for aid in self.classroom._assignments:
-            grade = self.classroom.get_grade(self.current_speaker, sid, aid)
-            if grade:
-                print(f"      {aid}: {grade['score']}/{grade['max']}  {grade.get('feedback', '')}")
+        out = [f"    GRADES FOR {self._name(sid)}:"]
+        for aid, state, score, mx, feedback in self.classroom.student_report(
+                self.current_speaker, sid):
+            if state == "graded":
+                out.append(f"      {aid}: {score}/{mx}  {feedback}")
+            elif state == "submitted":
+                out.append(f"      {aid}: submitted (not yet graded)")
             else:
-                sub = self.classroom.get_submission(self.current_speaker, sid, aid)
-                if sub:
-                    print(f"      {aid}: submitted (not yet graded)")
-                else:
-                    print(f"      {aid}: — (no submission)")
+                out.append(f"      {aid}: — (no submission)")
+        sys.stdout.write("\n".join(out) + "\n")
 
     def do_gradebook(self):
         rows = self.classroom.gradebook()
@@ -846,23 +1143,20 @@ class ClassroomShell:
             print("    Gradebook is empty.")
             return
 
-        assignments = self.classroom.list_assignments()
-        header = "    STUDENT          "
-        for a in assignments:
-            header += f"  {a['id'][-4:]}"
-        header += "  TOTAL"
-        print(header)
-        print("    " + "─" * (len(header) - 4))
+        cells = self.classroom.gradebook_flat()
+        # Every row carries the same columns, in assignment order
+        assignment_ids = list(rows[0]['grades'])
+        header = "  ".join(["    STUDENT          ", *(aid[-4:] for aid in assignment_ids), "TOTAL"])
+        out = [header, "    " + "─" * (len(header) - 4)]
 
         for row in rows:
-            line = f"    {row['student']:<20}"
-            for a in assignments:
-                aid = a['id']
-                g = row['grades'].get(aid, {})
-                score = g.get('score', '—')
-                line += f"  {str(score):>4}"
-            line += f"  {row['percentage']}%"
-            print(line)
+            sid = row['student_id']
+            parts = [f"    {row['student']:<20}"]
+            parts.extend(_GRADEBOOK_CELL_FMT % (cells.get((sid, aid), '—'),)
+                         for aid in assignment_ids)
+            parts.append(f"{row['percentage']}%")
+            out.append("  ".join(parts))
+        sys.stdout.write("\n".join(out) + "\n")
 
     def do_dispute(self, args: str):
         if self.current_speaker == self.teacher_id:
@@ -872,7 +1166,7 @@ class ClassroomShell:
             args = input("    Assignment ID: ").strip()
         reason = input("    Reason for dispute: ").strip() or "I believe I deserve a higher grade."
 
-        req_id = self.classroom.dispute_grade(self.current_speaker, args.strip(), reason)
+        req_id = self.classroom.dispute_grade(self.current_speaker, args, reason)
         if req_id is not None:
             print(f"    ✓ Dispute filed: request #{req_id}")
             print(f"      Reason: {reason}")
@@ -884,8 +1178,11 @@ class ClassroomShell:
         if self.current_speaker != self.teacher_id:
             print("    ✗ Only the teacher can open sessions.")
             return
-        title = args.strip() or input("    Session title: ").strip() or "Class"
+        title = args or input("    Session title: ").strip() or "Class"
         sid = self.classroom.open_session(title)
+        if not sid:
+            print("    ✗ The course world refused the session.")
+            return
         print(f"    ✓ Session opened: {sid} — {title}")
 
     def do_checkin(self, args: str):
@@ -894,84 +1191,80 @@ class ClassroomShell:
             return
         if not args:
             args = input("    Session ID: ").strip()
-        result = self.classroom.check_in(self.current_speaker, args.strip())
+        result = self.classroom.check_in(self.current_speaker, args)
         if result["status"] == "active":
-            print(f"    ✓ Checked in to {args.strip()}")
+            print(f"    ✓ Checked in to {args}")
         else:
             print(f"    ✗ {result['status']}: {result.get('reason', '')}")
 
     def do_inspect(self, args: str):
         if not args:
             args = input("    Inspect what? (speaker name or 'world'): ").strip()
-        if args.lower() == "world":
+        key = args.casefold()
+        if key == "world":
             info = self.helena.inspect_world(self.current_speaker, self.classroom.world_id)
             if info:
-                print(f"    WORLD: {info['name']}")
-                print(f"    Status: {info['status']}")
-                print(f"    Creator: {info['creator']}")
-                print(f"    Members:")
-                for m in info['members']:
-                    print(f"      #{m['id']} {m['name']} ({m['role']})")
+                out = [
+                    f"    WORLD: {info['name']}",
+                    f"    Status: {info['status']}",
+                    f"    Creator: {info['creator']}",
+                    "    Members:",
+                ]
+                out.extend(f"      #{m['id']} {m['name']} ({m['role']})"
+                           for m in info['members'])
+                sys.stdout.write("\n".join(out) + "\n")
         else:
-            sid = self._students.get(args.lower())
+            sid = self._resolve_student(args)
             if not sid:
-                if args.lower() == "teacher":
+                if key == "teacher":
                     sid = self.teacher_id
                 else:
                     print(f"    Unknown target: {args}")
                     return
             info = self.helena.mary.inspect_speaker(self.current_speaker, sid)
             if info:
-                print(f"    SPEAKER: {info['speaker']['name']} (#{info['speaker']['id']})")
-                print(f"    Status: {info['speaker']['status']}")
-                print(f"    Variables: {len(info['variables'])}")
-                print(f"    Expressions: {len(info['expressions'])}")
-                for e in info['expressions'][-5:]:
-                    print(f"      expr#{e['id']}: {e['action']} → {e['status']}")
+                out = [
+                    f"    SPEAKER: {info['speaker']['name']} (#{info['speaker']['id']})",
+                    f"    Status: {info['speaker']['status']}",
+                    f"    Variables: {len(info['variables'])}",
+                    f"    Expressions: {len(info['expressions'])}",
+                ]
+                out.extend(f"      expr#{e['id']}: {e['action']} → {e['status']}"
+                           for e in info['expressions'][-5:])
+                sys.stdout.write("\n".join(out) + "\n")
 
     def do_audit(self):
-        entries = self.helena.audit(self.current_speaker, self.classroom.world_id)
-        if not entries:
+        total, entries = self.helena.audit_tail(self.current_speaker,
+                                                self.classroom.world_id, 20)
+        if not total:
             print("    No audit entries.")
             return
-        print(f"    AUDIT LOG ({len(entries)} entries):")
-        for e in entries[-20:]:  # last 20
+        out = [f"    AUDIT LOG ({total} entries):"]
+        for e in entries:
             status = e['status'] or "—"
-            print(f"      #{e['entry_id']} [{status:>8}] {e['speaker']}: {e['action']}")
+            out.append(_LEDGER_LINE_FMT % (e['entry_id'], status, e['speaker'], e['action']))
+        sys.stdout.write("\n".join(out) + "\n")
 
     def do_ledger(self):
-        count = self.helena.mary.ledger_count(self.current_speaker)
-        entries = self.helena.mary.ledger_read(self.current_speaker,
-                                                max(0, count - 15), count)
-        integrity = self.helena.mary.ledger_verify()
-        print(f"    LEDGER (last 15 of {count} entries) — Integrity: {'VALID ✓' if integrity else 'BROKEN ✗'}")
+        count, entries, integrity = self.helena.mary.ledger_tail(self.current_speaker, 15)
+        out = [f"    LEDGER (last 15 of {count} entries) — Integrity: {'VALID ✓' if integrity else 'BROKEN ✗'}"]
         for e in entries:
             status = e.status.value if e.status else "—"
-            speaker = self.helena.get_speaker_name(e.speaker_id)
-            print(f"      #{e.entry_id} [{status:>8}] {speaker}: {e.action}")
+            speaker = self._name(e.speaker_id)
+            out.append(_LEDGER_LINE_FMT % (e.entry_id, status, speaker, e.action))
+        sys.stdout.write("\n".join(out) + "\n")
 
     def do_transcript(self, args: str):
         if not args:
             args = input("    Student name: ").strip()
-        sid = self._students.get(args.strip().lower())
+        sid = self._resolve_student(args)
         if not sid:
             print(f"    ✗ Unknown student: {args}")
             return
 
         t = self.classroom.transcript(sid)
-        print()
-        print("    ╔══════════════════════════════════════════════╗")
-        print(f"    ║  TRANSCRIPT                                  ║")
-        print("    ╠══════════════════════════════════════════════╣")
-        print(f"    ║  Student: {t['student_name']:<35} ║")
-        print(f"    ║  Course:  {t['course']:<35} ║")
-        print(f"    ║  Teacher: {t['teacher']:<35} ║")
-        print(f"    ║  Final:   {t['final_score']} ({t['percentage']}%){' ' * (26 - len(str(t['final_score'])) - len(str(t['percentage'])))}║")
-        print(f"    ║  Submitted: {t['assignments_submitted']:<33} ║")
-        print(f"    ║  Missed:    {t['assignments_missed']:<33} ║")
-        print(f"    ║  Ledger:    {t['ledger_hash']:<33} ║")
-        print("    ╚══════════════════════════════════════════════╝")
-        print()
+        final_line = f"{t['final_score']} ({t['percentage']}%)"
+        print(_TRANSCRIPT_TEMPLATE.format(final_line=final_line, **t))
 
     def do_archive(self):
         if self.current_speaker != self.teacher_id:
@@ -984,7 +1277,7 @@ class ClassroomShell:
 
     def do_status(self):
         print(f"    {self.helena}")
-        print(f"    Current speaker: {self.helena.get_speaker_name(self.current_speaker)}")
+        print(f"    Current speaker: {self._name(self.current_speaker)}")
         print(f"    Ledger integrity: {'VALID ✓' if self.helena.mary.ledger_verify() else 'BROKEN ✗'}")
         print(f"    Ledger entries: {self.helena.mary.ledger_count(self.current_speaker)}")
 
@@ -995,14 +1288,14 @@ class ClassroomShell:
         """
         if not args:
             args = input("    Student name to tamper with: ").strip()
-        sid = self._students.get(args.strip().lower())
+        sid = self._resolve_student(args)
         if not sid:
             print(f"    ✗ Unknown student: {args}")
             return
 
         print()
         print("    ⚠  TAMPER ATTEMPT ⚠")
-        print(f"    Attempting to modify {self.helena.get_speaker_name(sid)}'s submission as teacher...")
+        print(f"    Attempting to modify {self._name(sid)}'s submission as teacher...")
         print()
 
         # Try to write to student's partition
@@ -1018,13 +1311,10 @@ class ClassroomShell:
             print()
 
             # Show the ledger caught it
-            entries = self.helena.mary.ledger_search(
-                self.teacher_id, operation="write_violation"
-            )
-            if entries:
-                e = entries[-1]
+            e = self.helena.mary.ledger_last(self.teacher_id, "write_violation")
+            if e:
                 print(f"    Ledger entry #{e.entry_id}: write_violation")
-                print(f"    Speaker: {self.helena.get_speaker_name(e.speaker_id)}")
+                print(f"    Speaker: {self._name(e.speaker_id)}")
                 print(f"    Action: {e.action}")
                 print(f"    Status: {e.status.value}")
                 print(f"    Reason: {e.break_reason}")
@@ -1040,6 +1330,7 @@ class ClassroomShell:
         if not args:
             return
         aid = self.helena.create_speaker(args)
+        self._name_cache[aid] = args
         self.classroom.add_admin(aid)
         self._admin_id = aid
         print(f"    ✓ Admin added: {args} (speaker #{aid}) — READ-ONLY")
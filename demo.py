@@ -14,10 +14,13 @@ After this runs, you can use classroom.py for the interactive shell.
 from mary import Mary, Status
 from helena import Helena, WorldPermissions
 from classroom import Classroom
+import sys
 import time
 
 
 def divider(title):
+    # Output is block-buffered; each finished layer is written out here
+    sys.stdout.flush()
     print()
     print(f"── {title} ──")
 
@@ -197,7 +200,7 @@ def main():
     assignments = classroom.list_assignments()
     header = f"  {'STUDENT':<15}"
     for a in assignments:
-        header += f" {a['title'][:12]:>12}"
+        header += f" {a.title[:12]:>12}"
     header += f" {'TOTAL':>8}"
     print(header)
     print("  " + "─" * (len(header) - 2))
@@ -205,7 +208,7 @@ def main():
     for row in gradebook:
         line = f"  {row['student']:<15}"
         for a in assignments:
-            g = row['grades'].get(a['id'], {})
+            g = row['grades'].get(a.id, {})
             score = g.get('score', '—')
             mx = g.get('max', '')
             if isinstance(score, int):
@@ -305,14 +308,15 @@ def main():
     print(f"    Version: {james_sub['version']} (single submission, no process)")
     print(f"    Content hash: {james_sub['content_hash']}")
     print(f"    → If this matched another student's hash, the timestamps would tell the story.")
+    print(f"    Matching hashes on {a1}: {len(classroom.matching_submissions(a1))} group(s)")
 
     # ================================================================
     # LAYER 14: Full Audit
     # ================================================================
     divider("AUDIT (last 25 entries)")
 
-    entries = helena.audit(teacher_id, classroom.world_id)
-    for e in entries[-25:]:
+    _, entries = helena.audit_tail(teacher_id, classroom.world_id, 25)
+    for e in entries:
         status = e['status'] or "—"
         print(f"  #{e['entry_id']:>3} [{status:>8}] {e['speaker']:<16} {e['action']}")
 
@@ -323,7 +327,7 @@ def main():
     print(f"  {helena}")
     print(f"  Ledger entries:  {helena.mary.ledger_count(teacher_id)}")
     print(f"  Hash chain:      {'VALID ✓' if helena.mary.ledger_verify() else 'BROKEN ✗'}")
-    print(f"  Speakers:        {len(helena.mary.list_speakers(teacher_id))}")
+    print(f"  Speakers:        {helena.mary.speaker_count(teacher_id)}")
     print(f"  Worlds:          {len(helena.list_worlds(teacher_id))}")
     print()
 
@@ -353,4 +357,8 @@ def main():
 
 
 if __name__ == "__main__":
+    # A terminal makes stdout line-buffered: one write() per print.
+    # Buffer whole layers instead; divider() and exit flush them.
+    if getattr(sys.stdout, "line_buffering", False):
+        sys.stdout.reconfigure(line_buffering=False)
     main()
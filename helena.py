@@ -18,14 +18,22 @@ from typing import Any, Optional
 from dataclasses import dataclass, field
 from mary import Mary, Status, Version, SpeakerStatus, Position
 
+# Canonical JSON for receipts. json.dumps builds a fresh encoder on every
+# call when given options; this one is built once and emits the same bytes.
+_json_encode = json.JSONEncoder(sort_keys=True, default=str).encode
+
+
+def _canonical_json(content: Any) -> bytes:
+    return _json_encode(content).encode()
+
 
 # =============================================================================
 # Part I — World
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class WorldPermissions:
-    """What a member can do in a world."""
+    """What a member can do in a world. Immutable, so members can share one."""
     read: bool = True
     write: bool = True
     submit: bool = True
@@ -33,6 +41,22 @@ class WorldPermissions:
     invite: bool = False
     configure: bool = False
 
+    def mask(self) -> int:
+        """These permissions packed into bits (see _PERM_BITS)."""
+        return sum(bit for name, bit in _PERM_BITS.items() if getattr(self, name))
+
+
+# Permission name -> bit in a packed member mask
+_PERM_BITS = {"read": 1, "write": 2, "submit": 4,
+              "request": 8, "invite": 16, "configure": 32}
+
+# Shared permission sets
+_CREATOR_PERMS = WorldPermissions(
+    read=True, write=True, submit=True,
+    request=True, invite=True, configure=True,
+)
+_DEFAULT_PERMS = WorldPermissions()
+
 
 class WorldStatus:
     OPEN = "open"
@@ -40,7 +64,7 @@ class WorldStatus:
     ARCHIVED = "archived"
 
 
-@dataclass
+@dataclass(slots=True)
 class WorldMember:
     """A speaker's membership in a world."""
     speaker_id: int
@@ -49,7 +73,7 @@ class WorldMember:
     role: str = "member"  # creator, member, observer
 
 
-@dataclass
+@dataclass(slots=True)
 class World:
     """An isolated environment where speakers create, compute, interact."""
     world_id: str
@@ -59,6 +83,20 @@ class World:
     status: str = WorldStatus.OPEN
     members: dict = field(default_factory=dict)  # speaker_id -> WorldMember
     namespace: str = ""  # prefix for variables
+    # speaker_id -> packed permission mask, kept beside members for can()
+    _perm_bits: dict = field(default_factory=dict, repr=False)
+    # Bumped on every join and leave, so callers can tell a roster is stale
+    membership_version: int = field(default=0, repr=False)
+
+    def add_member(self, member: WorldMember):
+        self.members[member.speaker_id] = member
+        self._perm_bits[member.speaker_id] = member.permissions.mask()
+        self.membership_version += 1
+
+    def remove_member(self, speaker_id: int):
+        del self.members[speaker_id]
+        del self._perm_bits[speaker_id]
+        self.membership_version += 1
 
     def is_member(self, speaker_id: int) -> bool:
         return speaker_id in self.members
@@ -68,10 +106,7 @@ class World:
         return member.permissions if member else None
 
     def can(self, speaker_id: int, permission: str) -> bool:
-        perms = self.get_permissions(speaker_id)
-        if perms is None:
-            return False
-        return getattr(perms, permission, False)
+        return bool(self._perm_bits.get(speaker_id, 0) & _PERM_BITS.get(permission, 0))
 
 
 # =============================================================================
@@ -96,9 +131,13 @@ class Helena:
         # World registry
         self._worlds: dict[str, World] = {}
         self._next_world_id: int = 0
+        # speaker_id -> world_ids they belong to (insertion-ordered dict as a set)
+        self._speaker_worlds: dict[int, dict[str, None]] = {}
 
         # Block list (helena-level, not mary-level)
-        self._blocks: dict[int, set] = {}  # speaker_id -> set of blocked speaker_ids
+        # speaker_id -> bitmask of blocked speaker_ids (bit n = speaker n).
+        # Mary hands out ids sequentially from 0, so masks stay small.
+        self._blocks: dict[int, int] = {}
 
         # Subscriptions
         self._subscriptions: dict[int, list] = {}  # speaker_id -> list of subscriptions
@@ -148,18 +187,15 @@ class Helena:
         )
 
         # Creator gets full permissions
-        creator_perms = WorldPermissions(
-            read=True, write=True, submit=True,
-            request=True, invite=True, configure=True,
-        )
-        world.members[creator_id] = WorldMember(
+        world.add_member(WorldMember(
             speaker_id=creator_id,
-            permissions=creator_perms,
+            permissions=_CREATOR_PERMS,
             joined_at=time.time(),
             role="creator",
-        )
+        ))
 
         self._worlds[world_id] = world
+        self._speaker_worlds.setdefault(creator_id, {})[world_id] = None
 
         # Log in mary
         self.mary.write(self.speaker.id, f"worlds.{world_id}.name", name)
@@ -171,7 +207,6 @@ class Helena:
             speaker_id=creator_id,
             condition_label="⊤",
             action=f"create_world:{world_id}:{name}",
-            action_fn=lambda: True,
         )
 
         return world_id
@@ -188,19 +223,19 @@ class Helena:
             return False
 
         if permissions is None:
-            permissions = WorldPermissions()
+            permissions = _DEFAULT_PERMS
 
-        world.members[speaker_id] = WorldMember(
+        world.add_member(WorldMember(
             speaker_id=speaker_id,
             permissions=permissions,
             joined_at=time.time(),
-        )
+        ))
+        self._speaker_worlds.setdefault(speaker_id, {})[world_id] = None
 
         self.mary.submit(
             speaker_id=speaker_id,
             condition_label=f"invited_to:{world_id}",
             action=f"join_world:{world_id}",
-            action_fn=lambda: True,
         )
 
         return True
@@ -221,7 +256,6 @@ class Helena:
             speaker_id=inviter_id,
             condition_label="⊤",
             action=f"invite:{target_id}:to:{world_id}",
-            action_fn=lambda: True,
         )
 
         # Auto-join with specified permissions (simplified — real version would require acceptance)
@@ -235,13 +269,13 @@ class Helena:
         if speaker_id not in world.members:
             return False
 
-        del world.members[speaker_id]
+        world.remove_member(speaker_id)
+        self._speaker_worlds[speaker_id].pop(world_id, None)
 
         self.mary.submit(
             speaker_id=speaker_id,
             condition_label="⊤",
             action=f"leave_world:{world_id}",
-            action_fn=lambda: True,
         )
 
         return True
@@ -261,7 +295,6 @@ class Helena:
             speaker_id=caller_id,
             condition_label="⊤",
             action=f"archive_world:{world_id}",
-            action_fn=lambda: True,
         )
 
         return True
@@ -272,7 +305,7 @@ class Helena:
 
     def list_worlds(self, speaker_id: int) -> list[World]:
         """List worlds a speaker belongs to."""
-        return [w for w in self._worlds.values() if w.is_member(speaker_id)]
+        return [self._worlds[wid] for wid in self._speaker_worlds.get(speaker_id, ())]
 
     # ── World-Scoped Operations ───────────────────────────────────────
 
@@ -291,6 +324,22 @@ class Helena:
         full_var = f"{world_id}.{speaker_id}.{var_name}"
         return self.mary.write(speaker_id, full_var, value)
 
+    def world_write_many(self, speaker_id: int, world_id: str,
+                         values: dict[str, Any]) -> bool:
+        """Write several variables within a world's namespace. One ledger entry."""
+        world = self._worlds.get(world_id)
+        if not world:
+            return False
+        if not world.can(speaker_id, "write"):
+            return False
+        if world.status == WorldStatus.ARCHIVED:
+            return False
+
+        prefix = f"{world_id}.{speaker_id}."
+        return self.mary.write_many(
+            speaker_id, {prefix + k: v for k, v in values.items()}
+        )
+
     def world_read(self, caller_id: int, world_id: str,
                    owner_id: int, var_name: str) -> Any:
         """Read a variable within a world's namespace."""
@@ -303,6 +352,53 @@ class Helena:
         full_var = f"{world_id}.{owner_id}.{var_name}"
         return self.mary.read(caller_id, owner_id, full_var)
 
+    def world_multi_read(self, caller_id: int, world_id: str,
+                         owner_id: int, var_names: list[str]) -> dict[str, Any]:
+        """
+        Read several of one owner's variables within a world.
+        One permission check, one Mary read. Returns {var_name: value}.
+        """
+        world = self._worlds.get(world_id)
+        if not world:
+            return {}
+        if not world.can(caller_id, "read"):
+            return {}
+
+        prefix = f"{world_id}.{owner_id}."
+        values = self.mary.read_many(caller_id, owner_id,
+                                     [prefix + var for var in var_names])
+        cut = len(prefix)
+        return {full_var[cut:]: value for full_var, value in values.items()}
+
+    def world_snapshot(self, caller_id: int, world_id: str,
+                       key_prefix: str = None,
+                       owner_ids: list[int] = None) -> dict[tuple[int, str], Any]:
+        """
+        Read several members' world variables at once.
+        Returns {(owner_id, var_name): value}. One Mary read per partition.
+        owner_ids picks the partitions; every member's by default.
+        Non-members are skipped.
+        """
+        world = self._worlds.get(world_id)
+        if not world:
+            return {}
+        if not world.can(caller_id, "read"):
+            return {}
+
+        if owner_ids is None:
+            owner_ids = list(world.members)
+        snap = {}
+        for owner_id in owner_ids:
+            if owner_id not in world.members:
+                continue
+            prefix = f"{world_id}.{owner_id}."
+            values = self.mary.snapshot(caller_id, owner_id,
+                                        prefix + (key_prefix or ""))
+            cut = len(prefix)
+            for full_var, value in values.items():
+                snap[(owner_id, full_var[cut:])] = value
+        return snap
+
     def world_list_vars(self, caller_id: int, world_id: str,
                         owner_id: int) -> list[str]:
         """List variables for a speaker in a world."""
@@ -314,7 +410,22 @@ class Helena:
 
         prefix = f"{world_id}.{owner_id}."
         all_vars = self.mary.list_vars(caller_id, owner_id)
-        return [v.replace(prefix, "") for v in all_vars if v.startswith(prefix)]
+        cut = len(prefix)
+        return [v[cut:] for v in all_vars if v.startswith(prefix)]
+
+    def world_read_prefix(self, caller_id: int, world_id: str,
+                          owner_id: int, var_prefix: str) -> dict[str, Any]:
+        """Read every variable of one owner in a world that starts with var_prefix."""
+        world = self._worlds.get(world_id)
+        if not world:
+            return {}
+        if not world.can(caller_id, "read"):
+            return {}
+
+        prefix = f"{world_id}.{owner_id}."
+        values = self.mary.snapshot(caller_id, owner_id, prefix + var_prefix)
+        cut = len(prefix)
+        return {full_var[cut:]: value for full_var, value in values.items()}
 
     # ── Communication (World-Scoped) ──────────────────────────────────
 
@@ -336,28 +447,30 @@ class Helena:
     # ── Blocking ──────────────────────────────────────────────────────
 
     def block(self, speaker_id: int, target_id: int) -> bool:
-        """Block a speaker. Unilateral."""
-        if speaker_id not in self._blocks:
-            self._blocks[speaker_id] = set()
-        self._blocks[speaker_id].add(target_id)
+        """Block a speaker. Unilateral. Only registered speakers can be blocked."""
+        # Registered ids are non-negative, so they always fit the bitmask
+        if self.mary.registry.get(target_id) is None:
+            return False
+        self._blocks[speaker_id] = self._blocks.get(speaker_id, 0) | (1 << target_id)
 
         self.mary.submit(
             speaker_id=speaker_id,
             condition_label="⊤",
             action=f"block:{target_id}",
-            action_fn=lambda: True,
         )
         return True
 
     def unblock(self, speaker_id: int, target_id: int) -> bool:
         """Unblock a speaker."""
-        if speaker_id in self._blocks:
-            self._blocks[speaker_id].discard(target_id)
+        if speaker_id in self._blocks and target_id >= 0:
+            self._blocks[speaker_id] &= ~(1 << target_id)
         return True
 
     def is_blocked(self, speaker_id: int, by_speaker: int) -> bool:
         """Check if speaker_id is blocked by by_speaker."""
-        return speaker_id in self._blocks.get(by_speaker, set())
+        if speaker_id < 0:
+            return False
+        return bool(self._blocks.get(by_speaker, 0) >> speaker_id & 1)
 
     # ── Inspection ────────────────────────────────────────────────────
 
@@ -369,11 +482,12 @@ class Helena:
         if not world.can(caller_id, "read"):
             return None
 
+        names = self._speaker_names([*world.members, world.creator_id])
         members_info = []
         for sid, member in world.members.items():
             members_info.append({
                 "id": sid,
-                "name": self.get_speaker_name(sid),
+                "name": names[sid],
                 "role": member.role,
                 "joined_at": member.joined_at,
             })
@@ -381,7 +495,7 @@ class Helena:
         return {
             "world_id": world.world_id,
             "name": world.name,
-            "creator": self.get_speaker_name(world.creator_id),
+            "creator": names[world.creator_id],
             "status": world.status,
             "members": members_info,
             "created_at": world.created_at,
@@ -413,24 +527,50 @@ class Helena:
             to_time=to_time,
         )
 
-        # Filter to entries involving world members or world namespace
-        member_ids = set(world.members.keys())
-        world_entries = [
-            {
-                "entry_id": e.entry_id,
-                "speaker": self.get_speaker_name(e.speaker_id),
-                "speaker_id": e.speaker_id,
-                "operation": e.operation,
-                "action": e.action,
-                "status": e.status.value if e.status else None,
-                "timestamp": e.timestamp,
-                "break_reason": e.break_reason,
-            }
-            for e in entries
-            if e.speaker_id in member_ids or world_id in (e.action or "")
-        ]
-
-        return world_entries
+        return self._audit_records(self._world_entries(world, entries))
+
+    def audit_tail(self, caller_id: int, world_id: str,
+                   n: int = 20) -> tuple[int, list[dict]]:
+        """
+        The last n audit entries of a world, and how many there are in all.
+        Only the returned entries are turned into records.
+        """
+        world = self._worlds.get(world_id)
+        if not world or not world.can(caller_id, "read"):
+            return 0, []
+
+        matched = self._world_entries(world, self.mary.ledger_search(caller_id))
+        return len(matched), self._audit_records(matched[-n:])
+
+    def _world_entries(self, world: World, entries: list) -> list:
+        """Entries involving world members or the world namespace."""
+        # members is keyed by speaker_id: test against it, no set copy
+        members = world.members
+        world_id = world.world_id
+        return [e for e in entries
+                if e.speaker_id in members or world_id in (e.action or "")]
+
+    def _speaker_names(self, speaker_ids) -> dict[int, str]:
+        """Display names for a batch of speakers, each looked up once."""
+        return {sid: self.get_speaker_name(sid) for sid in dict.fromkeys(speaker_ids)}
+
+    def _audit_records(self, entries: list) -> list[dict]:
+        """Ledger entries as audit records. Names are read once per speaker per call."""
+        names = self._speaker_names(e.speaker_id for e in entries)
+        return [self._audit_record(e, names[e.speaker_id]) for e in entries]
+
+    def _audit_record(self, e, speaker_name: str) -> dict:
+        """One ledger entry as an audit record."""
+        return {
+            "entry_id": e.entry_id,
+            "speaker": speaker_name,
+            "speaker_id": e.speaker_id,
+            "operation": e.operation,
+            "action": e.action,
+            "status": e.status.value if e.status else None,
+            "timestamp": e.timestamp,
+            "break_reason": e.break_reason,
+        }
 
     # ── File Operations (Variables as Files) ──────────────────────────
 
@@ -461,8 +601,7 @@ class Helena:
     @staticmethod
     def hash_content(content: Any) -> str:
         """Generate a content hash for receipts."""
-        data = json.dumps(content, sort_keys=True, default=str)
-        return hashlib.sha256(data.encode()).hexdigest()[:16]
+        return hashlib.sha256(_canonical_json(content)).hexdigest()[:16]
 
     # ── System State ──────────────────────────────────────────────────
 
@@ -479,7 +618,7 @@ class Helena:
         }
 
     def __repr__(self):
-        s = self.state()
-        return (f"Helena(worlds={s['worlds']}, "
-                f"speakers={s['mary']['speakers']}, "
-                f"ledger={s['mary']['ledger_entries']})")
+        # Only counts: state() would also walk the whole hash chain
+        return (f"Helena(worlds={len(self._worlds)}, "
+                f"speakers={self.mary.registry.count()}, "
+                f"ledger={self.mary.ledger.count()})")
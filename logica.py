@@ -22,6 +22,7 @@ Not "are caught at runtime." Cannot be expressed.
 
 import sys
 import os
+import dataclasses
 
 # Ensure imports work
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -33,8 +34,8 @@ from logica.runtime import Runtime
 from logica.errors import LogicaError, AxiomViolation
 
 
-def run_source(source: str, filename: str = "<stdin>", quiet: bool = False):
-    """Run Logica source code through the full pipeline."""
+def compile_source(source: str):
+    """Lex, parse and axiom-check source once. Returns (ast, compiled)."""
     # Phase 1: Lex
     lexer = Lexer(source)
     tokens = lexer.tokenize()
@@ -47,6 +48,13 @@ def run_source(source: str, filename: str = "<stdin>", quiet: bool = False):
     compiler = Compiler()
     compiled = compiler.compile(ast)
 
+    return ast, compiled
+
+
+def run_source(source: str, filename: str = "<stdin>", quiet: bool = False):
+    """Run Logica source code through the full pipeline."""
+    _, compiled = compile_source(source)
+
     # Phase 4: Execute through Mary
     runtime = Runtime(quiet=quiet)
     runtime.execute(compiled)
@@ -100,12 +108,7 @@ def check_file(filepath: str):
         source = f.read()
 
     try:
-        lexer = Lexer(source)
-        tokens = lexer.tokenize()
-        parser = Parser(tokens)
-        ast = parser.parse()
-        compiler = Compiler()
-        compiled = compiler.compile(ast)
+        _, compiled = compile_source(source)
 
         print(f"  {os.path.basename(filepath)}: ALL AXIOMS HOLD")
         print(f"  speakers: {compiled.speakers}")
@@ -142,17 +145,8 @@ def transpile_file(filepath: str, output_path: str = None):
         source = f.read()
 
     try:
-        # Phase 1: Lex
-        lexer = Lexer(source)
-        tokens = lexer.tokenize()
-
-        # Phase 2: Parse
-        parser = Parser(tokens)
-        ast = parser.parse()
-
-        # Phase 3: Compile (axiom checking)
-        compiler = Compiler()
-        compiler.compile(ast)
+        # Phases 1-3: lex, parse, axiom check
+        ast, _ = compile_source(source)
 
         # Phase 4: Transpile to JS
         from logica.transpiler import JSTranspiler
@@ -263,26 +257,68 @@ def show_ast(filepath: str):
     _print_ast(ast, indent=0)
 
 
+def _node_fields(node):
+    """(name, value) pairs of an AST node's shown fields, slotted or not."""
+    return ((f.name, getattr(node, f.name))
+            for f in dataclasses.fields(node) if f.repr)
+
+
 def _print_ast(node, indent=0):
-    """Pretty-print an AST node."""
-    prefix = "  " * indent
-    name = type(node).__name__
-
-    if hasattr(node, 'statements'):
-        print(f"{prefix}{name}:")
-        for s in node.statements:
-            _print_ast(s, indent + 1)
-    elif hasattr(node, 'body') and isinstance(getattr(node, 'body'), list):
-        attrs = {k: v for k, v in node.__dict__.items()
-                 if k not in ('body', 'line', 'col', 'otherwise_body',
-                              'broken_body', 'elif_clauses', 'else_body')}
-        print(f"{prefix}{name}({attrs}):")
-        for s in node.body:
-            _print_ast(s, indent + 1)
-    else:
-        attrs = {k: v for k, v in node.__dict__.items()
-                 if k not in ('line', 'col') and v is not None}
-        print(f"{prefix}{name}({attrs})")
+    """Pretty-print an AST node. Lines are collected and written once."""
+    lines = []
+    stack = [(node, indent)]
+    while stack:
+        node, indent = stack.pop()
+        prefix = "  " * indent
+        name = type(node).__name__
+
+        if hasattr(node, 'statements'):
+            lines.append(f"{prefix}{name}:")
+            children = node.statements
+        elif hasattr(node, 'body') and isinstance(getattr(node, 'body'), list):
+            attrs = {k: v for k, v in _node_fields(node)
+                     if k not in ('body', 'line', 'col', 'otherwise_body',
+                                  'broken_body', 'elif_clauses', 'else_body')}
+            lines.append(f"{prefix}{name}({attrs}):")
+            children = node.body
+        else:
+            attrs = {k: v for k, v in _node_fields(node)
+                     if k not in ('line', 'col') and v is not None}
+            lines.append(f"{prefix}{name}({attrs})")
+            continue
+
+        # Reversed, so the first child is popped first
+        stack.extend((child, indent + 1) for child in reversed(children))
+
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _brace_delta(line: str) -> int:
+    """
+    Net '{' minus '}' on one REPL line, in a single pass.
+    Braces inside string literals and # comments are not counted, the
+    same way the lexer skips them. Strings cannot span lines.
+    """
+    depth = 0
+    quote = None
+    escaped = False
+    for ch in line:
+        if quote:
+            if escaped:
+                escaped = False
+            elif ch == '\\':
+                escaped = True
+            elif ch == quote:
+                quote = None
+        elif ch == '{':
+            depth += 1
+        elif ch == '}':
+            depth -= 1
+        elif ch in ('"', "'"):
+            quote = ch
+        elif ch == '#':
+            break
+    return depth
 
 
 def repl():
@@ -331,7 +367,7 @@ def repl():
                 continue
 
             # Track brace depth for multi-line input
-            brace_depth += line.count('{') - line.count('}')
+            brace_depth += _brace_delta(line)
             buffer.append(line)
 
             if brace_depth <= 0:
@@ -14,7 +14,7 @@ from typing import Optional, Any
 # Base
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class Node:
     """Base AST node. Every node has a source location."""
     line: int = 0
@@ -25,7 +25,7 @@ class Node:
 # Program
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Program(Node):
     """The root. A program is a sequence of top-level statements."""
     statements: list = field(default_factory=list)
@@ -35,20 +35,20 @@ class Program(Node):
 # Top-Level Declarations
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class SpeakerDecl(Node):
     """speaker Name"""
     name: str = ""
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class WorldDecl(Node):
     """world Name(args)"""
     name: str = ""
     args: list = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class AsBlock(Node):
     """
     as SpeakerName { ... }
@@ -64,7 +64,7 @@ class AsBlock(Node):
 # Statements
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class LetStatement(Node):
     """
     let name = expr
@@ -74,9 +74,17 @@ class LetStatement(Node):
     """
     name: str = ""
     value: 'Expression' = None
+    # Segments of a dotted name, split once when the node is built.
+    # None for a plain name.
+    name_parts: Optional[tuple] = field(default=None, init=False,
+                                        repr=False, compare=False)
 
+    def __post_init__(self):
+        if '.' in self.name:
+            self.name_parts = tuple(self.name.split('.'))
 
-@dataclass
+
+@dataclass(slots=True)
 class SpeakStatement(Node):
     """
     speak expr
@@ -86,7 +94,7 @@ class SpeakStatement(Node):
     value: 'Expression' = None
 
 
-@dataclass
+@dataclass(slots=True)
 class WhenBlock(Node):
     """
     when condition {
@@ -108,7 +116,7 @@ class WhenBlock(Node):
     broken_body: list = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class IfStatement(Node):
     """
     if condition { ... }
@@ -123,14 +131,14 @@ class IfStatement(Node):
     else_body: list = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ElifClause(Node):
     """One elif branch."""
     condition: 'Expression' = None
     body: list = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class WhileLoop(Node):
     """
     while condition, max N { ... }
@@ -143,7 +151,7 @@ class WhileLoop(Node):
     max_iterations: Optional['Expression'] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class FnDecl(Node):
     """
     fn name(params) { ... }
@@ -155,13 +163,13 @@ class FnDecl(Node):
     body: list = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ReturnStatement(Node):
     """return expr"""
     value: Optional['Expression'] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RequestStatement(Node):
     """
     request Target action_name
@@ -175,7 +183,7 @@ class RequestStatement(Node):
     data: Optional['Expression'] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RespondStatement(Node):
     """
     respond accept
@@ -186,7 +194,7 @@ class RespondStatement(Node):
     data: Optional['Expression'] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class InspectStatement(Node):
     """
     inspect target
@@ -195,7 +203,7 @@ class InspectStatement(Node):
     target: 'Expression' = None
 
 
-@dataclass
+@dataclass(slots=True)
 class HistoryStatement(Node):
     """
     history speaker.variable
@@ -205,7 +213,7 @@ class HistoryStatement(Node):
     target: 'Expression' = None
 
 
-@dataclass
+@dataclass(slots=True)
 class LedgerStatement(Node):
     """
     ledger
@@ -216,7 +224,7 @@ class LedgerStatement(Node):
     count: Optional['Expression'] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class VerifyStatement(Node):
     """
     verify ledger
@@ -226,7 +234,7 @@ class VerifyStatement(Node):
     target: str = "ledger"
 
 
-@dataclass
+@dataclass(slots=True)
 class SealStatement(Node):
     """
     seal variable
@@ -236,19 +244,19 @@ class SealStatement(Node):
     target: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class PassStatement(Node):
     """pass — do nothing."""
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class FailStatement(Node):
     """fail "reason" — explicitly break."""
     reason: Optional['Expression'] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ExpressionStatement(Node):
     """A bare expression as a statement (function call, etc.)."""
     expression: 'Expression' = None
@@ -258,49 +266,49 @@ class ExpressionStatement(Node):
 # Expressions
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class Expression(Node):
     """Base expression."""
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class IntegerLiteral(Expression):
     value: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class FloatLiteral(Expression):
     value: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class StringLiteral(Expression):
     value: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class BooleanLiteral(Expression):
     value: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class NoneLiteral(Expression):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class StatusLiteral(Expression):
     """active, inactive, broken — the three values."""
     value: str = "active"  # "active", "inactive", "broken"
 
 
-@dataclass
+@dataclass(slots=True)
 class Identifier(Expression):
     name: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class MemberAccess(Expression):
     """
     speaker.variable
@@ -312,14 +320,14 @@ class MemberAccess(Expression):
     member: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class IndexAccess(Expression):
     """expr[key]"""
     object: Expression = None
     index: Expression = None
 
 
-@dataclass
+@dataclass(slots=True)
 class BinaryOp(Expression):
     """expr op expr"""
     left: Expression = None
@@ -327,21 +335,21 @@ class BinaryOp(Expression):
     right: Expression = None
 
 
-@dataclass
+@dataclass(slots=True)
 class UnaryOp(Expression):
     """op expr"""
     op: str = ""
     operand: Expression = None
 
 
-@dataclass
+@dataclass(slots=True)
 class FnCall(Expression):
     """name(args) or speaker.name(args)"""
     function: Expression = None
     args: list = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ReadExpr(Expression):
     """
     read Speaker.variable
@@ -352,7 +360,7 @@ class ReadExpr(Expression):
     target: Expression = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ConditionalExpr(Expression):
     """expr if condition else expr"""
     condition: Expression = None
@@ -27,15 +27,15 @@ from .ast_nodes import *
 from .errors import AxiomViolation, ParseError
 from dataclasses import dataclass, field
 from typing import Optional, Any
-from enum import Enum, auto
+from enum import IntEnum, auto
 
 
 # =============================================================================
 # Compiled Operations — What the Runtime Executes
 # =============================================================================
 
-class OpType(Enum):
-    """The operations Mary understands."""
+class OpType(IntEnum):
+    """The operations Mary understands. Int-valued: hashing and compares stay in C."""
     CREATE_SPEAKER = auto()
     SET_SPEAKER = auto()       # switch active speaker context
     WRITE_VAR = auto()         # write to speaker's own variable
@@ -62,7 +62,7 @@ class OpType(Enum):
     EVAL_EXPR = auto()         # evaluate an expression
 
 
-@dataclass
+@dataclass(slots=True)
 class Operation:
     """One compiled operation."""
     op: OpType
@@ -71,7 +71,7 @@ class Operation:
     line: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class CompiledProgram:
     """The output of compilation. A list of operations."""
     operations: list = field(default_factory=list)
@@ -96,10 +96,43 @@ class Compiler:
         self.current_speaker: Optional[str] = None
         self.declared_speakers: set = set()
         self.declared_functions: dict = {}  # speaker.name -> params
-        self.sealed_vars: set = set()       # speaker.var names that are sealed
+        self.sealed_vars: set = set()       # (speaker, var) pairs that are sealed
         self.operations: list = []
         self.errors: list = []
 
+        # Statement type -> compile handler, built once per compiler
+        self._stmt_dispatch = {
+            SpeakerDecl: self._compile_speaker_decl,
+            WorldDecl: self._compile_world_decl,
+            AsBlock: self._compile_as_block,
+            LetStatement: self._compile_let,
+            SpeakStatement: self._compile_speak,
+            WhenBlock: self._compile_when,
+            IfStatement: self._compile_if,
+            WhileLoop: self._compile_while,
+            FnDecl: self._compile_fn,
+            ReturnStatement: self._compile_return,
+            RequestStatement: self._compile_request,
+            RespondStatement: self._compile_respond,
+            InspectStatement: self._compile_inspect,
+            HistoryStatement: self._compile_history,
+            LedgerStatement: self._compile_ledger,
+            VerifyStatement: self._compile_verify,
+            SealStatement: self._compile_seal,
+            PassStatement: self._compile_pass,
+            FailStatement: self._compile_fail,
+            ExpressionStatement: self._compile_expr_statement,
+        }
+        # Statement type -> block axiom check; other statements need none
+        self._block_checks = {
+            LetStatement: self._check_let_axioms,
+            WhileLoop: self._check_while_in_block,
+            WhenBlock: self._check_when_in_block,
+            IfStatement: self._check_if_in_block,
+            FnDecl: self._check_fn_in_block,
+            RequestStatement: self._check_request_in_block,
+        }
+
     def compile(self, program: Program) -> CompiledProgram:
         """Compile a program. Returns CompiledProgram or raises on error."""
         # First pass: collect all speaker declarations
@@ -118,8 +151,9 @@ class Compiler:
             )
 
         # Second pass: compile all statements
+        compile_statement = self._compile_statement
         for stmt in program.statements:
-            self._compile_statement(stmt)
+            compile_statement(stmt)
 
         if self.errors:
             raise self.errors[0]
@@ -134,48 +168,10 @@ class Compiler:
 
     def _compile_statement(self, stmt):
         """Compile a single statement."""
-        if isinstance(stmt, SpeakerDecl):
-            self._compile_speaker_decl(stmt)
-        elif isinstance(stmt, WorldDecl):
-            self._compile_world_decl(stmt)
-        elif isinstance(stmt, AsBlock):
-            self._compile_as_block(stmt)
-        elif isinstance(stmt, LetStatement):
-            self._compile_let(stmt)
-        elif isinstance(stmt, SpeakStatement):
-            self._compile_speak(stmt)
-        elif isinstance(stmt, WhenBlock):
-            self._compile_when(stmt)
-        elif isinstance(stmt, IfStatement):
-            self._compile_if(stmt)
-        elif isinstance(stmt, WhileLoop):
-            self._compile_while(stmt)
-        elif isinstance(stmt, FnDecl):
-            self._compile_fn(stmt)
-        elif isinstance(stmt, ReturnStatement):
-            self._compile_return(stmt)
-        elif isinstance(stmt, RequestStatement):
-            self._compile_request(stmt)
-        elif isinstance(stmt, RespondStatement):
-            self._compile_respond(stmt)
-        elif isinstance(stmt, InspectStatement):
-            self._compile_inspect(stmt)
-        elif isinstance(stmt, HistoryStatement):
-            self._compile_history(stmt)
-        elif isinstance(stmt, LedgerStatement):
-            self._compile_ledger(stmt)
-        elif isinstance(stmt, VerifyStatement):
-            self._compile_verify(stmt)
-        elif isinstance(stmt, SealStatement):
-            self._compile_seal(stmt)
-        elif isinstance(stmt, PassStatement):
-            self._emit(OpType.PASS, line=stmt.line)
-        elif isinstance(stmt, FailStatement):
-            self._compile_fail(stmt)
-        elif isinstance(stmt, ExpressionStatement):
-            self._compile_expr_statement(stmt)
-        else:
+        handler = self._stmt_dispatch.get(type(stmt))
+        if handler is None:
             raise ParseError(f"unknown statement type: {type(stmt).__name__}")
+        handler(stmt)
 
     def _compile_speaker_decl(self, stmt: SpeakerDecl):
         """Compile speaker declaration."""
@@ -210,8 +206,9 @@ class Compiler:
                    args={"name": stmt.speaker_name},
                    line=stmt.line)
 
+        compile_statement = self._compile_statement
         for body_stmt in stmt.body:
-            self._compile_statement(body_stmt)
+            compile_statement(body_stmt)
 
         self.current_speaker = prev_speaker
         if prev_speaker:
@@ -225,38 +222,9 @@ class Compiler:
 
         Axiom 8: Write Ownership — you can only write to your own variables.
         """
-        self._check_speaker_context(stmt)
-
-        # Check for write ownership violation
-        # Check every segment of the dotted name, not just the first,
-        # to catch cases like 'let bar.SpeakerName.baz = 1'
-        name = stmt.name
-        if '.' in name:
-            parts = name.split('.')
-            for part in parts:
-                if part in self.declared_speakers and part != self.current_speaker:
-                    raise AxiomViolation(
-                        8, "Write Ownership",
-                        f"speaker '{self.current_speaker}' cannot write to "
-                        f"'{part}' variables. "
-                        f"Only '{part}' can write to '{part}' variables. "
-                        f"This is not a permission. It is math.",
-                        line=stmt.line
-                    )
-
-        # Check for sealed variable
-        sealed_key = f"{self.current_speaker}.{name}"
-        if sealed_key in self.sealed_vars:
-            raise AxiomViolation(
-                5, "Ledger Integrity",
-                f"variable '{name}' is sealed. "
-                f"Sealed variables cannot be overwritten. "
-                f"The ledger preserves all state.",
-                line=stmt.line
-            )
-
+        self._check_let_axioms(stmt)
         self._emit(OpType.WRITE_VAR,
-                   args={"name": name, "value_ast": stmt.value},
+                   args={"name": stmt.name, "value_ast": stmt.value},
                    line=stmt.line)
 
     def _compile_speak(self, stmt: SpeakStatement):
@@ -283,9 +251,12 @@ class Compiler:
                    line=stmt.line)
 
         # Check axioms in bodies without emitting duplicate ops
-        self._check_block_axioms(stmt.body)
-        self._check_block_axioms(stmt.otherwise_body)
-        self._check_block_axioms(stmt.broken_body)
+        if stmt.body:
+            self._check_block_axioms(stmt.body)
+        if stmt.otherwise_body:
+            self._check_block_axioms(stmt.otherwise_body)
+        if stmt.broken_body:
+            self._check_block_axioms(stmt.broken_body)
 
     def _compile_if(self, stmt: IfStatement):
         """Compile if/elif/else."""
@@ -407,12 +378,15 @@ class Compiler:
     def _compile_seal(self, stmt: SealStatement):
         """Compile seal."""
         self._check_speaker_context(stmt)
-        sealed_key = f"{self.current_speaker}.{stmt.target}"
-        self.sealed_vars.add(sealed_key)
+        self.sealed_vars.add((self.current_speaker, stmt.target))
         self._emit(OpType.SEAL,
                    args={"name": stmt.target},
                    line=stmt.line)
 
+    def _compile_pass(self, stmt: PassStatement):
+        """Compile pass."""
+        self._emit(OpType.PASS, line=stmt.line)
+
     def _compile_fail(self, stmt: FailStatement):
         """Compile explicit fail."""
         self._check_speaker_context(stmt)
@@ -435,55 +409,88 @@ class Compiler:
         Used for bodies of when/if/while/fn where the parent op
         handles execution and we only need to verify axioms.
         """
+        checks = self._block_checks
         for stmt in stmts:
-            if isinstance(stmt, LetStatement):
-                self._check_speaker_context(stmt)
-                name = stmt.name
-                if '.' in name:
-                    parts = name.split('.')
-                    for part in parts:
-                        if part in self.declared_speakers and part != self.current_speaker:
-                            raise AxiomViolation(
-                                8, "Write Ownership",
-                                f"speaker '{self.current_speaker}' cannot write to "
-                                f"'{part}' variables. "
-                                f"Only '{part}' can write to '{part}' variables. "
-                                f"This is not a permission. It is math.",
-                                line=stmt.line
-                            )
-                sealed_key = f"{self.current_speaker}.{name}"
-                if sealed_key in self.sealed_vars:
-                    raise AxiomViolation(
-                        5, "Ledger Integrity",
-                        f"variable '{name}' is sealed.",
-                        line=stmt.line
-                    )
-            elif isinstance(stmt, WhileLoop) and stmt.max_iterations is None:
-                raise AxiomViolation(
-                    9, "No Infinite Loops",
-                    "every loop must have a 'max N' bound.",
-                    line=stmt.line
-                )
-            elif isinstance(stmt, WhenBlock):
-                self._check_block_axioms(stmt.body)
-                self._check_block_axioms(stmt.otherwise_body)
-                self._check_block_axioms(stmt.broken_body)
-            elif isinstance(stmt, IfStatement):
-                self._check_block_axioms(stmt.body)
-                for clause in stmt.elif_clauses:
-                    self._check_block_axioms(clause.body)
-                self._check_block_axioms(stmt.else_body)
-            elif isinstance(stmt, WhileLoop):
-                self._check_block_axioms(stmt.body)
-            elif isinstance(stmt, FnDecl):
-                self._check_block_axioms(stmt.body)
-            elif isinstance(stmt, RequestStatement):
-                if stmt.target not in self.declared_speakers:
-                    raise AxiomViolation(
-                        1, "Speaker Requirement",
-                        f"request target '{stmt.target}' is not a declared speaker.",
-                        line=stmt.line
-                    )
+            check = checks.get(type(stmt))
+            if check is not None:
+                check(stmt)
+
+    def _check_let_axioms(self, stmt: LetStatement):
+        """
+        Axioms for 'let name = expr', shared by compile and block checks.
+
+        Axiom 1: there is a speaker.
+        Axiom 8: Write Ownership — no segment of a dotted name may be
+        another speaker, to catch cases like 'let bar.SpeakerName.baz = 1'.
+        Axiom 5: sealed variables are not overwritten.
+        """
+        self._check_speaker_context(stmt)
+
+        name = stmt.name
+        current = self.current_speaker
+        parts = stmt.name_parts
+        if parts is not None:
+            speakers = self.declared_speakers
+            # One C-level disjointness test; walk the parts only on a hit
+            if not speakers.isdisjoint(parts):
+                for part in parts:
+                    if part in speakers and part != current:
+                        raise AxiomViolation(
+                            8, "Write Ownership",
+                            f"speaker '{current}' cannot write to "
+                            f"'{part}' variables. "
+                            f"Only '{part}' can write to '{part}' variables. "
+                            f"This is not a permission. It is math.",
+                            line=stmt.line
+                        )
+
+        if (current, name) in self.sealed_vars:
+            raise AxiomViolation(
+                5, "Ledger Integrity",
+                f"variable '{name}' is sealed. "
+                f"Sealed variables cannot be overwritten. "
+                f"The ledger preserves all state.",
+                line=stmt.line
+            )
+
+    def _check_while_in_block(self, stmt: WhileLoop):
+        if stmt.max_iterations is None:
+            raise AxiomViolation(
+                9, "No Infinite Loops",
+                "every loop must have a 'max N' bound.",
+                line=stmt.line
+            )
+        if stmt.body:
+            self._check_block_axioms(stmt.body)
+
+    def _check_when_in_block(self, stmt: WhenBlock):
+        if stmt.body:
+            self._check_block_axioms(stmt.body)
+        if stmt.otherwise_body:
+            self._check_block_axioms(stmt.otherwise_body)
+        if stmt.broken_body:
+            self._check_block_axioms(stmt.broken_body)
+
+    def _check_if_in_block(self, stmt: IfStatement):
+        if stmt.body:
+            self._check_block_axioms(stmt.body)
+        for clause in stmt.elif_clauses:
+            if clause.body:
+                self._check_block_axioms(clause.body)
+        if stmt.else_body:
+            self._check_block_axioms(stmt.else_body)
+
+    def _check_fn_in_block(self, stmt: FnDecl):
+        if stmt.body:
+            self._check_block_axioms(stmt.body)
+
+    def _check_request_in_block(self, stmt: RequestStatement):
+        if stmt.target not in self.declared_speakers:
+            raise AxiomViolation(
+                1, "Speaker Requirement",
+                f"request target '{stmt.target}' is not a declared speaker.",
+                line=stmt.line
+            )
 
     # ── Expression Analysis ───────────────────────────────────────────
 
@@ -53,17 +53,8 @@ class Runtime:
     def __init__(self, quiet=False):
         self.env = Environment()
         self.quiet = quiet
-
-    def execute(self, compiled: CompiledProgram):
-        """Execute a compiled program."""
-        for op in compiled.operations:
-            if self.env.returning:
-                break
-            self._execute_op(op)
-
-    def _execute_op(self, op: Operation):
-        """Execute a single operation."""
-        dispatch = {
+        # OpType -> handler, built once per runtime
+        self._op_dispatch = {
             OpType.CREATE_SPEAKER: self._op_create_speaker,
             OpType.SET_SPEAKER: self._op_set_speaker,
             OpType.WRITE_VAR: self._op_write_var,
@@ -85,7 +76,19 @@ class Runtime:
             OpType.CREATE_WORLD: self._op_create_world,
             OpType.EVAL_EXPR: self._op_eval_expr,
         }
-        handler = dispatch.get(op.op)
+
+    def execute(self, compiled: CompiledProgram):
+        """Execute a compiled program."""
+        env = self.env
+        execute_op = self._execute_op
+        for op in compiled.operations:
+            if env.returning:
+                break
+            execute_op(op)
+
+    def _execute_op(self, op: Operation):
+        """Execute a single operation."""
+        handler = self._op_dispatch.get(op.op)
         if handler:
             handler(op)
 
@@ -148,7 +151,6 @@ class Runtime:
             speaker_id=sid,
             condition_label="speak",
             action=f"speak:{repr(value)}",
-            action_fn=lambda: True,
         )
 
         output = f"  [{speaker_name}] {value}"
@@ -186,7 +188,6 @@ class Runtime:
                     speaker_id=sid,
                     condition_label="when:active",
                     action="when_block",
-                    action_fn=lambda: True,
                 )
             except Exception as e:
                 # Action failed — broken path
@@ -202,7 +203,7 @@ class Runtime:
             # Inactive path
             self.env.mary.submit(
                 speaker_id=sid,
-                condition=lambda: False,
+                condition=False,
                 condition_label="when:inactive",
                 action="when_block",
             )
@@ -264,7 +265,7 @@ class Runtime:
                 # Condition unmet — loop ends (inactive)
                 self.env.mary.submit(
                     speaker_id=sid,
-                    condition=lambda: False,
+                    condition=False,
                     condition_label="loop:terminated",
                     action=f"loop:iterations={count}",
                 )
@@ -435,7 +436,6 @@ class Runtime:
             speaker_id=sid,
             condition_label="seal",
             action=f"seal:{name}",
-            action_fn=lambda: True,
         )
 
         if not self.quiet:
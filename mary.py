@@ -117,7 +117,7 @@ class Expression:
     """A Human Logic expression: speaker : condition ⊢ action"""
     expression_id: int
     speaker_id: int
-    condition: Optional[Callable]  # function that returns True/False
+    condition: Optional[Callable | bool]  # returns True/False, or a constant
     condition_label: str           # human-readable description
     action: str                    # what to do
     action_fn: Optional[Callable]  # function that performs the action
@@ -146,6 +146,19 @@ class Ledger:
     def __init__(self):
         self._entries: list[LedgerEntry] = []
         self._last_hash: str = "genesis"
+        # Shared string table for the fixed label vocabulary (operation,
+        # break_reason). Actions and conditions embed ids, so not shared.
+        self._strings: dict[str, str] = {}
+        # operation -> entry_ids, in append order
+        self._by_operation: dict[str, list[int]] = {}
+        # speaker_id -> entry_ids, in append order
+        self._by_speaker: dict[int, list[int]] = {}
+
+    def _shared(self, text: Optional[str]) -> Optional[str]:
+        """Return the ledger's canonical copy of a repeated string."""
+        if text is None:
+            return None
+        return self._strings.setdefault(text, text)
 
     def append(self, speaker_id: int, operation: str, action: str,
                condition: str = None, condition_result: bool = None,
@@ -155,7 +168,7 @@ class Ledger:
         entry = LedgerEntry(
             entry_id=len(self._entries),
             speaker_id=speaker_id,
-            operation=operation,
+            operation=self._shared(operation),
             condition=condition,
             condition_result=condition_result,
             action=action,
@@ -164,11 +177,13 @@ class Ledger:
             state_after=state_after,
             timestamp=time.time(),
             prev_hash=self._last_hash,
-            break_reason=break_reason,
+            break_reason=self._shared(break_reason),
         )
         entry.entry_hash = entry.compute_hash()
         self._last_hash = entry.entry_hash
         self._entries.append(entry)
+        self._by_operation.setdefault(entry.operation, []).append(entry.entry_id)
+        self._by_speaker.setdefault(speaker_id, []).append(entry.entry_id)
         return entry
 
     def read(self, from_id: int = 0, to_id: int = None) -> list[LedgerEntry]:
@@ -180,12 +195,21 @@ class Ledger:
     def search(self, speaker_id: int = None, operation: str = None,
                action: str = None, from_time: float = None,
                to_time: float = None) -> list[LedgerEntry]:
-        """Search entries by filters."""
+        """Search entries by filters. Speaker and operation use the indexes."""
         results = self._entries
-        if speaker_id is not None:
-            results = [e for e in results if e.speaker_id == speaker_id]
-        if operation is not None:
-            results = [e for e in results if e.operation == operation]
+        if speaker_id is not None or operation is not None:
+            ids = None
+            if speaker_id is not None:
+                ids = self._by_speaker.get(speaker_id, ())
+            if operation is not None:
+                by_op = self._by_operation.get(operation, ())
+                if ids is None or len(by_op) < len(ids):
+                    ids = by_op
+            results = [results[i] for i in ids]
+            if speaker_id is not None:
+                results = [e for e in results if e.speaker_id == speaker_id]
+            if operation is not None:
+                results = [e for e in results if e.operation == operation]
         if action is not None:
             results = [e for e in results if e.action == action]
         if from_time is not None:
@@ -195,7 +219,12 @@ class Ledger:
         return results
 
     def verify_integrity(self) -> bool:
-        """Walk the hash chain. Return True if unbroken."""
+        """
+        Walk the hash chain. Return True if unbroken.
+        Every entry is re-hashed from its own fields, from genesis, on every
+        call: a cached digest or verified-up-to mark would keep saying VALID
+        after an old entry was edited in place.
+        """
         if not self._entries:
             return True
         expected_prev = "genesis"
@@ -213,6 +242,11 @@ class Ledger:
     def last(self) -> Optional[LedgerEntry]:
         return self._entries[-1] if self._entries else None
 
+    def last_of(self, operation: str) -> Optional[LedgerEntry]:
+        """Newest entry for an operation, from the operation index."""
+        ids = self._by_operation.get(operation)
+        return self._entries[ids[-1]] if ids else None
+
 
 # =============================================================================
 # Part IV — Memory (Speaker-Partitioned)
@@ -247,10 +281,11 @@ class Memory:
         Write to caller's own partition ONLY.
         Returns (success, old_value).
         """
-        if caller_id not in self._partitions:
+        partition = self._partitions.get(caller_id)
+        if partition is None:
             return False, None
-        old_value = self._partitions[caller_id].get(var_name)
-        self._partitions[caller_id][var_name] = value
+        old_value = partition.get(var_name)
+        partition[var_name] = value
         return True, old_value
 
     def write_check(self, caller_id: int, target_id: int) -> bool:
@@ -314,6 +349,10 @@ class SpeakerRegistry:
         """List all speakers."""
         return list(self._speakers.values())
 
+    def count(self) -> int:
+        """Number of speakers, without listing them."""
+        return len(self._speakers)
+
 
 # =============================================================================
 # Part VI — Request Bus
@@ -458,10 +497,15 @@ class Evaluator:
             return None
 
         # Step 2: Check condition
-        condition_met = True
-        if expr.condition is not None:
+        # None/True/False are constant conditions: no call needed
+        condition = expr.condition
+        if condition is None or condition is True:
+            condition_met = True
+        elif condition is False:
+            condition_met = False
+        else:
             try:
-                condition_met = expr.condition()
+                condition_met = condition()
             except Exception:
                 condition_met = False
 
@@ -681,6 +725,12 @@ class Mary:
             return []
         return self.registry.list_all()
 
+    def speaker_count(self, caller_id: int) -> int:
+        """Count speakers. Any authenticated speaker can do this."""
+        if not self.registry.authenticate(caller_id):
+            return 0
+        return self.registry.count()
+
     # ── Memory Operations ─────────────────────────────────────────────────
 
     def read(self, caller_id: int, owner_id: int, var_name: str) -> Any:
@@ -709,6 +759,63 @@ class Mary:
 
         return value
 
+    def read_many(self, caller_id: int, owner_id: int,
+                  var_names: list[str]) -> dict[str, Any]:
+        """
+        Read several of one speaker's variables at once.
+        One authentication, one ledger entry. Missing variables come back None.
+        """
+        action = f"read_many:{owner_id}.{','.join(var_names)}"
+        if not self.registry.authenticate(caller_id):
+            self.ledger.append(
+                speaker_id=caller_id,
+                operation="read_many",
+                action=action,
+                status=Status.BROKEN,
+                break_reason="caller_not_authenticated",
+            )
+            return {}
+
+        values = {var: self.memory.read(owner_id, var) for var in var_names}
+
+        self.ledger.append(
+            speaker_id=caller_id,
+            operation="read_many",
+            action=action,
+            status=Status.ACTIVE,
+            state_after={"values": {var: repr(v) for var, v in values.items()}},
+        )
+
+        return values
+
+    def snapshot(self, caller_id: int, owner_id: int, prefix: str = "") -> dict[str, Any]:
+        """
+        Read every variable in a speaker's partition that starts with prefix.
+        One authentication, one ledger entry, however many variables match.
+        """
+        if not self.registry.authenticate(caller_id):
+            self.ledger.append(
+                speaker_id=caller_id,
+                operation="snapshot",
+                action=f"snapshot:{owner_id}.{prefix}*",
+                status=Status.BROKEN,
+                break_reason="caller_not_authenticated",
+            )
+            return {}
+
+        values = {k: v for k, v in self.memory.get_partition(owner_id).items()
+                  if k.startswith(prefix)}
+
+        self.ledger.append(
+            speaker_id=caller_id,
+            operation="snapshot",
+            action=f"snapshot:{owner_id}.{prefix}*",
+            status=Status.ACTIVE,
+            state_after={"values": {var: repr(v) for var, v in values.items()}},
+        )
+
+        return values
+
     def write(self, caller_id: int, var_name: str, value: Any) -> bool:
         """
         Write to caller's OWN variables only.
@@ -738,6 +845,43 @@ class Mary:
 
         return success
 
+    def write_many(self, caller_id: int, values: dict[str, Any]) -> bool:
+        """
+        Write several of caller's OWN variables under a single ledger entry.
+        Same ownership rule as write(). The entry keeps every old and new value.
+        """
+        action = f"write_many:{','.join(values)}"
+        if not self.registry.authenticate(caller_id):
+            self.ledger.append(
+                speaker_id=caller_id,
+                operation="write_many",
+                action=action,
+                status=Status.BROKEN,
+                break_reason="caller_not_authenticated",
+            )
+            return False
+
+        old_values = {}
+        new_values = {}
+        success = True
+        for var_name, value in values.items():
+            ok, old_value = self.memory.write(caller_id, var_name, value)
+            success = success and ok
+            old_values[var_name] = repr(old_value)
+            new_values[var_name] = repr(value)
+
+        self.ledger.append(
+            speaker_id=caller_id,
+            operation="write_many",
+            action=action,
+            status=Status.ACTIVE if success else Status.BROKEN,
+            state_before={"old_values": old_values},
+            state_after={"new_values": new_values},
+            break_reason=None if success else "write_failed",
+        )
+
+        return success
+
     def write_to(self, caller_id: int, target_id: int, var_name: str, value: Any) -> bool:
         """
         Attempt to write to ANOTHER speaker's variables.
@@ -762,7 +906,7 @@ class Mary:
 
     # ── Expression Management ─────────────────────────────────────────────
 
-    def submit(self, speaker_id: int, condition: Callable = None,
+    def submit(self, speaker_id: int, condition: Callable | bool = None,
                condition_label: str = "⊤", action: str = "",
                action_fn: Callable = None, is_refusal: bool = False,
                scope_until: float = None) -> Optional[Expression]:
@@ -843,6 +987,32 @@ class Mary:
         status, count = self.evaluator.evaluate_loop(expr)
         return expr, count
 
+    def record_broken(self, speaker_id: int, condition_label: str,
+                      action: str, reason: str) -> Optional[LedgerEntry]:
+        """
+        Record an expression the caller already knows is broken.
+        One ledger entry, no expression state: nothing to evaluate or supersede.
+        """
+        if not self.registry.authenticate(speaker_id):
+            self.ledger.append(
+                speaker_id=speaker_id,
+                operation="submit",
+                action=action,
+                status=Status.BROKEN,
+                break_reason="speaker_not_authenticated",
+            )
+            return None
+
+        return self.ledger.append(
+            speaker_id=speaker_id,
+            operation="submit",
+            action=action,
+            condition=condition_label,
+            condition_result=False,
+            status=Status.BROKEN,
+            break_reason=reason,
+        )
+
     def get_expression(self, expr_id: int) -> Optional[Expression]:
         """Get an expression by ID."""
         return self._expressions.get(expr_id)
@@ -956,6 +1126,12 @@ class Mary:
             return []
         return self.ledger.search(**filters)
 
+    def ledger_last(self, caller_id: int, operation: str) -> Optional[LedgerEntry]:
+        """Most recent ledger entry for an operation."""
+        if not self.registry.authenticate(caller_id):
+            return None
+        return self.ledger.last_of(operation)
+
     def ledger_count(self, caller_id: int) -> int:
         """Count total ledger entries."""
         if not self.registry.authenticate(caller_id):
@@ -966,6 +1142,19 @@ class Mary:
         """Verify ledger hash chain integrity."""
         return self.ledger.verify_integrity()
 
+    def ledger_tail(self, caller_id: int,
+                    n: int = 15) -> tuple[int, list[LedgerEntry], bool]:
+        """
+        The last n entries in one call: (count, entries, integrity).
+        Integrity is always the full chain walk — a verified prefix can still
+        be tampered with later, so nothing about it is cached.
+        """
+        integrity = self.ledger.verify_integrity()
+        if not self.registry.authenticate(caller_id):
+            return 0, [], integrity
+        count = self.ledger.count()
+        return count, self.ledger.read(max(0, count - n), count), integrity
+
     # ── Inspection ────────────────────────────────────────────────────────
 
     def inspect_speaker(self, caller_id: int, target_id: int) -> Optional[dict]:
@@ -999,23 +1188,31 @@ class Mary:
         if not self.registry.authenticate(caller_id):
             return None
         current = self.memory.read(owner_id, var_name)
-        history = self.ledger.search(
-            speaker_id=owner_id,
-            action=f"write:{var_name}",
-        )
+        single_action = f"write:{var_name}"
+        history = []
+        for e in self.ledger.search(speaker_id=owner_id):
+            if e.action == single_action:
+                before, after = e.state_before, e.state_after
+            elif (e.operation == "write_many" and e.state_after
+                    and var_name in e.state_after["new_values"]):
+                # Batched write — pull this variable's slice out of the entry
+                before = {"var": var_name,
+                          "old_value": e.state_before["old_values"][var_name]}
+                after = {"var": var_name,
+                         "new_value": e.state_after["new_values"][var_name]}
+            else:
+                continue
+            history.append({
+                "entry_id": e.entry_id,
+                "before": before,
+                "after": after,
+                "timestamp": e.timestamp,
+            })
         return {
             "owner": owner_id,
             "variable": var_name,
             "current_value": current,
-            "history": [
-                {
-                    "entry_id": e.entry_id,
-                    "before": e.state_before,
-                    "after": e.state_after,
-                    "timestamp": e.timestamp,
-                }
-                for e in history
-            ],
+            "history": history,
         }
 
     # ── State ─────────────────────────────────────────────────────────────
@@ -1023,7 +1220,7 @@ class Mary:
     def state(self) -> dict:
         """Complete system state snapshot."""
         return {
-            "speakers": len(self.registry.list_all()),
+            "speakers": self.registry.count(),
             "ledger_entries": self.ledger.count(),
             "ledger_integrity": self.ledger.verify_integrity(),
             "expressions": len(self._expressions),